@@ -1,11 +1,13 @@
 """
 API models module for the trading bot.
 
-This module provides the Pydantic models for the API.
+This module provides the Pydantic models for the API, plus msgspec structs
+used to encode the hot read endpoints.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Dict, Any, Literal, Optional
 from datetime import datetime
 
 class StatusResponse(BaseModel):
@@ -30,6 +32,21 @@ class TradeResponse(BaseModel):
     timestamp: str = Field(..., description="Trade timestamp")
     status: str = Field(..., description="Trade status")
 
+class TradeStruct(msgspec.Struct, frozen=True):
+    """
+    Trade response struct.
+    
+    Mirrors TradeResponse for the /trades endpoint, encoded directly by msgspec.
+    """
+    
+    id: str
+    symbol: str
+    type: str
+    price: float
+    amount: float
+    timestamp: str
+    status: str
+
 class BalanceResponse(BaseModel):
     """
     Balance response model.
@@ -54,11 +71,29 @@ class PositionResponse(BaseModel):
     profit_loss: float = Field(..., description="Profit/loss")
     profit_loss_percentage: float = Field(..., description="Profit/loss percentage")
 
+class PositionStruct(msgspec.Struct, frozen=True):
+    """
+    Position response struct.
+    
+    Mirrors PositionResponse for the /positions endpoint, encoded directly by msgspec.
+    """
+    
+    symbol: str
+    amount: float
+    entry_price: float
+    current_price: float
+    stop_loss: float
+    take_profit: float
+    profit_loss: float
+    profit_loss_percentage: float
+
 class ConfigUpdateRequest(BaseModel):
     """
     Configuration update request model.
     """
     
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     trading_pairs: Optional[List[str]] = Field(None, description="Trading pairs")
     risk_percentage: Optional[float] = Field(None, description="Risk percentage")
     max_position_size: Optional[float] = Field(None, description="Maximum position size")
@@ -75,8 +110,10 @@ class TradeRequest(BaseModel):
     Trade request model.
     """
     
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     symbol: str = Field(..., description="Trading pair symbol")
-    type: str = Field(..., description="Trade type ('buy' or 'sell')")
+    type: Literal["buy", "sell"] = Field(..., description="Trade type ('buy' or 'sell')")
     amount: float = Field(..., description="Trade amount")
     price: Optional[float] = Field(None, description="Trade price (for limit orders)")
 
@@ -85,6 +122,8 @@ class BacktestRequest(BaseModel):
     Backtest request model.
     """
     
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     symbol: str = Field(..., description="Trading pair symbol")
     start_date: str = Field(..., description="Start date (ISO format)")
     end_date: str = Field(..., description="End date (ISO format)")
@@ -6,42 +6,133 @@ This module provides the FastAPI routes for the API.
 
 import logging
 import asyncio
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from typing import List, Dict, Any, Optional
+import os
+import ccxt
+import msgspec
+from concurrent.futures import ProcessPoolExecutor
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import List, Dict, Any, Optional, Tuple
 
 from app.api.models import (
     StatusResponse,
     TradeResponse,
+    TradeStruct,
     BalanceResponse,
     PositionResponse,
+    PositionStruct,
     ConfigUpdateRequest,
     TradeRequest,
     BacktestRequest,
     BacktestResponse,
 )
-from app.config import get_config, validate_config
+from app.config import validate_config
 from app.bot import TradingBot
+from app.state import BotState
 
 logger = logging.getLogger(__name__)
 
 # Create router
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# Global variables
-bot_instance = None
+# JSON and MessagePack encoders for the msgspec response structs
+json_encoder = msgspec.json.Encoder()
+msgpack_encoder = msgspec.msgpack.Encoder()
+
+# Process pool for CPU-heavy backtests (keeps them off the event loop), created on first use
+_backtest_pool: Optional[ProcessPoolExecutor] = None
+
+# Cached configuration (validated once, bumped on every /config update)
+_config_cache = {"valid": None, "config": None, "version": 0}
+
+# Encoded /status config (re-encoded when the config version changes)
+_status_cache = {"version": -1, "config": b"{}"}
+_STATUS_RUNNING_PREFIX = b'{"status":"running","running":true,"config":'
+_STATUS_STOPPED_PREFIX = b'{"status":"stopped","running":false,"config":'
+
+# Configuration paths (section, key) for each ConfigUpdateRequest field
+CONFIG_UPDATE_PATHS = {
+    "trading_pairs": ("trading", "pairs"),
+    "risk_percentage": ("trading", "risk_percentage"),
+    "max_position_size": ("trading", "max_position_size"),
+    "stop_loss_percentage": ("trading", "stop_loss_percentage"),
+    "take_profit_percentage": ("trading", "take_profit_percentage"),
+    "short_ma_period": ("indicators", "short_ma_period"),
+    "long_ma_period": ("indicators", "long_ma_period"),
+    "rsi_period": ("indicators", "rsi_period"),
+    "rsi_buy_threshold": ("indicators", "rsi_buy_threshold"),
+    "rsi_sell_threshold": ("indicators", "rsi_sell_threshold"),
+}
+
+def get_current_config() -> Tuple[bool, Dict[str, Any]]:
+    """
+    Get the current configuration, including /config updates.
+    
+    The configuration is validated once and then served from the cache.
+    
+    Returns:
+        Tuple[bool, Dict[str, Any]]: True if the configuration is valid (False otherwise), and the configuration dictionary.
+    """
+    if _config_cache["valid"] is None:
+        _config_cache["valid"], _config_cache["config"] = validate_config()
+    
+    return _config_cache["valid"], _config_cache["config"]
 
 # Dependency to check if the bot is configured
 async def check_config():
-    if not validate_config():
+    valid, config = get_current_config()
+    
+    if not valid:
         raise HTTPException(
             status_code=500,
             detail="Bot is not properly configured. Check the logs for details.",
         )
-    return get_config()
+    return config
+
+def _run_backtest_sync(backtest_request: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run a backtest synchronously in a worker process.
+    
+    Args:
+        backtest_request (Dict[str, Any]): Backtest request fields.
+        config (Dict[str, Any]): Bot configuration.
+    
+    Returns:
+        Dict[str, Any]: Backtest results.
+    """
+    async def _backtest() -> Dict[str, Any]:
+        # Create the bot inside the event loop (its asyncio primitives need a current loop on Python 3.9)
+        bot = TradingBot(config)
+        return await bot.backtest(**backtest_request)
+    
+    return asyncio.run(_backtest())
+
+def _get_backtest_pool() -> ProcessPoolExecutor:
+    """
+    Get the backtest process pool, creating it on first use.
+    
+    Returns:
+        ProcessPoolExecutor: Backtest process pool.
+    """
+    global _backtest_pool
+    
+    if _backtest_pool is None:
+        _backtest_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _backtest_pool
+
+def shutdown_backtest_pool() -> None:
+    """
+    Shut down the backtest process pool, if it was created.
+    """
+    global _backtest_pool
+    
+    if _backtest_pool is not None:
+        _backtest_pool.shutdown(cancel_futures=True)
+        _backtest_pool = None
 
 # Dependency to check if the bot is running
 async def check_bot_running():
-    from app.main import bot_instance
+    bot_instance = BotState.instance
     
     if bot_instance is None or not bot_instance.is_running:
         raise HTTPException(
@@ -72,25 +163,33 @@ async def get_status(config: Dict[str, Any] = Depends(check_config)):
     Returns:
         StatusResponse: Bot status.
     """
-    from app.main import bot_instance
+    bot_instance = BotState.instance
     
     is_running = bot_instance is not None and bot_instance.is_running
     
-    return {
-        "status": "running" if is_running else "stopped",
-        "running": is_running,
-        "config": config,
-    }
+    # Re-encode the config only when it has changed since the last call
+    if _status_cache["version"] != _config_cache["version"]:
+        _status_cache["config"] = json_encoder.encode(config)
+        _status_cache["version"] = _config_cache["version"]
+    
+    content = (_STATUS_RUNNING_PREFIX if is_running else _STATUS_STOPPED_PREFIX) + _status_cache["config"] + b"}"
+    
+    return Response(content=content, media_type="application/json")
 
 @router.get("/trades", response_model=List[TradeResponse])
 async def get_trades(
+    request: Request,
     bot = Depends(check_bot_running),
     config: Dict[str, Any] = Depends(check_config),
 ):
     """
     Get the history of trades.
     
+    Returns MessagePack instead of JSON when the client sends
+    `Accept: application/msgpack`.
+    
     Args:
+        request (Request): Incoming request.
         bot: Bot instance.
         config (Dict[str, Any]): Bot configuration.
     
@@ -100,20 +199,13 @@ async def get_trades(
     # Get trades from the order manager
     trades = bot.order_manager.get_all_orders()
     
-    # Convert to TradeResponse format
-    trade_responses = []
-    for trade in trades:
-        trade_responses.append({
-            "id": trade["id"],
-            "symbol": trade["symbol"],
-            "type": trade["type"],
-            "price": trade["price"],
-            "amount": trade["amount"],
-            "timestamp": trade["timestamp"],
-            "status": trade["status"],
-        })
+    # Convert to TradeResponse format (msgspec picks the response fields and drops the rest)
+    trade_responses = msgspec.convert(trades, List[TradeStruct])
+    
+    if "application/msgpack" in request.headers.get("accept", ""):
+        return Response(content=msgpack_encoder.encode(trade_responses), media_type="application/msgpack")
     
-    return trade_responses
+    return Response(content=json_encoder.encode(trade_responses), media_type="application/json")
 
 @router.get("/balance", response_model=BalanceResponse)
 async def get_balance(
@@ -131,8 +223,8 @@ async def get_balance(
         BalanceResponse: Current balance.
     """
     try:
-        # Get balance from Binance
-        balance = bot.binance_api.get_balance()
+        # Get balance from Binance (ccxt is blocking, keep it off the event loop)
+        balance = await asyncio.to_thread(bot.binance_api.get_balance)
         
         # Calculate total balance
         total_balance = 0.0
@@ -144,35 +236,48 @@ async def get_balance(
         for currency, data in balance["total"].items():
             if isinstance(data, (int, float)) and data > 0:
                 currencies[currency] = data
-                
-                # Get current price if not USDT
-                if currency != "USDT":
-                    try:
-                        ticker = bot.binance_api.get_ticker(f"{currency}/USDT")
-                        price = ticker["last"]
-                        total_balance += data * price
-                    except:
-                        # Skip if we can't get the price
-                        pass
-                else:
-                    total_balance += data
+        
+        # Get current prices for all non-USDT currencies listed against USDT in one request
+        market_symbols = await asyncio.to_thread(bot.binance_api.get_symbols)
+        symbols = [
+            f"{currency}/USDT"
+            for currency in currencies
+            if currency != "USDT" and f"{currency}/USDT" in market_symbols
+        ]
+        tickers = {}
+        if symbols:
+            try:
+                tickers = await asyncio.to_thread(bot.binance_api.get_tickers, symbols)
+            except (ccxt.BadSymbol, ccxt.NetworkError) as e:
+                # Skip valuation if we can't get the prices
+                logger.warning("Could not fetch tickers for balance valuation: %s", e)
+        
+        # Value each currency in USDT
+        for currency, data in currencies.items():
+            if currency == "USDT":
+                total_balance += data
+                continue
+            
+            ticker = tickers.get(f"{currency}/USDT")
+            if ticker is not None and ticker["last"] is not None:
+                total_balance += data * ticker["last"]
         
         # Calculate in_trade balance
         positions = bot.risk_manager.get_all_positions()
         for position in positions:
-            in_trade += position["amount"] * position["current_price"]
+            in_trade += position.amount * position.current_price
         
         # Calculate available balance
         available_balance = total_balance - in_trade
         
-        return {
+        return ORJSONResponse(content={
             "total_balance": total_balance,
             "available_balance": available_balance,
             "in_trade": in_trade,
             "currencies": currencies,
-        }
+        })
     except Exception as e:
-        logger.exception(f"Error getting balance: {e}")
+        logger.exception("Error getting balance: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error getting balance: {str(e)}",
@@ -197,20 +302,9 @@ async def get_positions(
     positions = bot.risk_manager.get_all_positions()
     
     # Convert to PositionResponse format
-    position_responses = []
-    for position in positions:
-        position_responses.append({
-            "symbol": position["symbol"],
-            "amount": position["amount"],
-            "entry_price": position["entry_price"],
-            "current_price": position["current_price"],
-            "stop_loss": position["stop_loss"],
-            "take_profit": position["take_profit"],
-            "profit_loss": position["profit_loss"],
-            "profit_loss_percentage": position["profit_loss_percentage"],
-        })
+    position_responses = msgspec.convert(positions, List[PositionStruct], from_attributes=True)
     
-    return position_responses
+    return Response(content=json_encoder.encode(position_responses), media_type="application/json")
 
 @router.post("/trade", response_model=TradeResponse)
 async def create_trade(
@@ -230,37 +324,31 @@ async def create_trade(
         TradeResponse: Trade response.
     """
     try:
-        # Create the trade
-        if trade_request.type.lower() == "buy":
-            order = bot.order_manager.create_buy_order(
-                symbol=trade_request.symbol,
-                amount=trade_request.amount,
-                price=trade_request.price,
-            )
-        elif trade_request.type.lower() == "sell":
-            order = bot.order_manager.create_sell_order(
-                symbol=trade_request.symbol,
-                amount=trade_request.amount,
-                price=trade_request.price,
-            )
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid trade type: {trade_request.type}",
-            )
+        # Create the trade (the trade type is validated by TradeRequest)
+        create_order = {
+            "buy": bot.order_manager.create_buy_order,
+            "sell": bot.order_manager.create_sell_order,
+        }[trade_request.type]
+        order = create_order(
+            symbol=trade_request.symbol,
+            amount=trade_request.amount,
+            price=trade_request.price,
+        )
         
-        # Return the trade response
-        return {
-            "id": order["id"],
-            "symbol": order["symbol"],
-            "type": order["type"],
-            "price": order["price"],
-            "amount": order["amount"],
-            "timestamp": order["timestamp"],
-            "status": order["status"],
-        }
+        # Return the trade response (order data is trusted, skip validation)
+        trade_response = TradeResponse.model_construct(
+            id=order["id"],
+            symbol=order["symbol"],
+            type=order["type"],
+            price=order["price"],
+            amount=order["amount"],
+            timestamp=order["timestamp"],
+            status=order["status"],
+        )
+        
+        return Response(content=trade_response.model_dump_json(), media_type="application/json")
     except Exception as e:
-        logger.exception(f"Error creating trade: {e}")
+        logger.exception("Error creating trade: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error creating trade: {str(e)}",
@@ -282,21 +370,43 @@ async def run_backtest(
         BacktestResponse: Backtest response.
     """
     try:
-        # Create a bot instance for backtesting
-        bot = TradingBot(config)
+        # Run the backtest in the process pool
+        result = await asyncio.get_running_loop().run_in_executor(
+            _get_backtest_pool(),
+            _run_backtest_sync,
+            backtest_request.model_dump(),
+            config,
+        )
         
-        # Run the backtest
-        result = await bot.backtest(
-            symbol=backtest_request.symbol,
-            start_date=backtest_request.start_date,
-            end_date=backtest_request.end_date,
-            timeframe=backtest_request.timeframe,
-            initial_balance=backtest_request.initial_balance,
+        # Build the response without validation (the result is produced by the bot)
+        trades = result["trades"]
+        columns = zip(
+            trades["type"].tolist(),
+            trades["price"].tolist(),
+            trades["amount"].tolist(),
+            trades["timestamp"].tolist(),
+        )
+        backtest_response = BacktestResponse.model_construct(
+            **{
+                **result,
+                "trades": [
+                    TradeResponse.model_construct(
+                        id=str(i),
+                        symbol=result["symbol"],
+                        type=trade_type,
+                        price=price,
+                        amount=amount,
+                        timestamp=timestamp,
+                        status="completed",
+                    )
+                    for i, (trade_type, price, amount, timestamp) in enumerate(columns, start=1)
+                ],
+            }
         )
         
-        return result
+        return Response(content=backtest_response.model_dump_json(), media_type="application/json")
     except Exception as e:
-        logger.exception(f"Error running backtest: {e}")
+        logger.exception("Error running backtest: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error running backtest: {str(e)}",
@@ -318,45 +428,26 @@ async def update_config(
         Dict[str, str]: Success message.
     """
     try:
-        # Update configuration
-        if config_update.trading_pairs is not None:
-            config["trading"]["pairs"] = config_update.trading_pairs
-        
-        if config_update.risk_percentage is not None:
-            config["trading"]["risk_percentage"] = config_update.risk_percentage
-        
-        if config_update.max_position_size is not None:
-            config["trading"]["max_position_size"] = config_update.max_position_size
-        
-        if config_update.stop_loss_percentage is not None:
-            config["trading"]["stop_loss_percentage"] = config_update.stop_loss_percentage
-        
-        if config_update.take_profit_percentage is not None:
-            config["trading"]["take_profit_percentage"] = config_update.take_profit_percentage
-        
-        if config_update.short_ma_period is not None:
-            config["indicators"]["short_ma_period"] = config_update.short_ma_period
-        
-        if config_update.long_ma_period is not None:
-            config["indicators"]["long_ma_period"] = config_update.long_ma_period
-        
-        if config_update.rsi_period is not None:
-            config["indicators"]["rsi_period"] = config_update.rsi_period
-        
-        if config_update.rsi_buy_threshold is not None:
-            config["indicators"]["rsi_buy_threshold"] = config_update.rsi_buy_threshold
+        # Build the updated configuration as a copy, so readers never see a half-applied update
+        new_config = dict(config)
+        for field, value in config_update.model_dump(exclude_none=True).items():
+            section, key = CONFIG_UPDATE_PATHS[field]
+            if new_config[section] is config[section]:
+                new_config[section] = dict(config[section])
+            new_config[section][key] = value
         
-        if config_update.rsi_sell_threshold is not None:
-            config["indicators"]["rsi_sell_threshold"] = config_update.rsi_sell_threshold
+        # Publish the updated configuration
+        _config_cache["config"] = new_config
+        _config_cache["version"] += 1
         
-        # If the bot is running, update its configuration
-        from app.main import bot_instance
+        # If the bot is running, apply the new configuration to it
+        bot_instance = BotState.instance
         if bot_instance is not None and bot_instance.is_running:
-            bot_instance.config = config
+            bot_instance.update_config(new_config)
         
         return {"message": "Configuration updated successfully"}
     except Exception as e:
-        logger.exception(f"Error updating configuration: {e}")
+        logger.exception("Error updating configuration: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error updating configuration: {str(e)}",
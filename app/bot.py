@@ -7,9 +7,11 @@ This module provides the main bot class that ties everything together.
 import logging
 import asyncio
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Optional, Sequence
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from datetime import date, datetime, time as dt_time, timedelta
+from numba import njit
 
 from app.config import get_config
 from app.data.collector import BinanceDataCollector
@@ -22,6 +24,113 @@ from app.notification.telegram import create_telegram_notifier
 
 logger = logging.getLogger(__name__)
 
+# Number of symbols fetched concurrently, and the pause between batches (Binance rate limits)
+FETCH_BATCH_SIZE = 5
+FETCH_BATCH_DELAY = 0.2
+
+# Notification text for each exit type returned by RiskManager.check_exits
+EXIT_REASONS = {
+    "stop_loss": "Stop loss triggered",
+    "take_profit": "Take profit triggered",
+}
+
+def _end_bound(end_date: str) -> datetime:
+    """
+    Get the exclusive end bound of a backtest end date.
+    
+    A date-only end date includes the whole day, and a date with a time
+    includes that moment, as slicing the DataFrame with the date string did.
+    
+    Args:
+        end_date (str): End date (ISO format).
+    
+    Returns:
+        datetime: First moment after the backtest range.
+    """
+    try:
+        return datetime.combine(date.fromisoformat(end_date) + timedelta(days=1), dt_time())
+    except ValueError:
+        return datetime.fromisoformat(end_date) + timedelta(milliseconds=1)
+
+@njit(cache=True)
+def _run_backtest(
+    close: np.ndarray,
+    buy_signal: np.ndarray,
+    sell_signal: np.ndarray,
+    stop_loss_factor: float,
+    take_profit_factor: float,
+    initial_balance: float,
+):
+    """
+    Run the backtest state machine over precomputed signals.
+    
+    Args:
+        close (np.ndarray): Close prices.
+        buy_signal (np.ndarray): Buy signal for each bar.
+        sell_signal (np.ndarray): Sell signal for each bar.
+        stop_loss_factor (float): Stop loss price as a fraction of the entry price.
+        take_profit_factor (float): Take profit price as a fraction of the entry price.
+        initial_balance (float): Initial balance.
+    
+    Returns:
+        Tuple: Final balance, trade prices, trade amounts, trade types (0 = buy,
+            1 = sell), trade bar indices and the number of trades.
+    """
+    n = len(close)
+    
+    # Trade log as preallocated columns (at most one trade per bar plus the final sell)
+    trade_prices = np.empty(n + 1, dtype=np.float64)
+    trade_amounts = np.empty(n + 1, dtype=np.float64)
+    trade_types = np.empty(n + 1, dtype=np.int8)
+    trade_idx = np.empty(n + 1, dtype=np.int64)
+    n_trades = 0
+    
+    balance = initial_balance
+    in_position = False
+    position_amount = 0.0
+    stop_loss_price = 0.0
+    take_profit_price = 0.0
+    
+    for i in range(1, n):
+        current_price = close[i]
+        
+        if not in_position:
+            if buy_signal[i]:
+                # Buy signal: use 95% of balance
+                position_amount = (balance * 0.95) / current_price
+                stop_loss_price = current_price * stop_loss_factor
+                take_profit_price = current_price * take_profit_factor
+                balance -= position_amount * current_price
+                in_position = True
+                
+                trade_prices[n_trades] = current_price
+                trade_amounts[n_trades] = position_amount
+                trade_types[n_trades] = 0
+                trade_idx[n_trades] = i
+                n_trades += 1
+        elif sell_signal[i] or current_price <= stop_loss_price or current_price >= take_profit_price:
+            # Sell signal, stop loss or take profit
+            balance += position_amount * current_price
+            in_position = False
+            
+            trade_prices[n_trades] = current_price
+            trade_amounts[n_trades] = position_amount
+            trade_types[n_trades] = 1
+            trade_idx[n_trades] = i
+            n_trades += 1
+    
+    # Sell any remaining position at the last price
+    if in_position:
+        balance += position_amount * close[n - 1]
+        
+        trade_prices[n_trades] = close[n - 1]
+        trade_amounts[n_trades] = position_amount
+        trade_types[n_trades] = 1
+        trade_idx[n_trades] = n - 1
+        n_trades += 1
+    
+    return balance, trade_prices, trade_amounts, trade_types, trade_idx, n_trades
+
 class TradingBot:
     """
     Trading bot.
@@ -68,41 +177,58 @@ class TradingBot:
         """
         Run the trading bot.
         """
+        streams = []
         try:
             self.is_running = True
             logger.info("Starting the trading bot...")
             
             if self.telegram_notifier:
-                await self.telegram_notifier.send_status_notification("Bot started")
+                self.telegram_notifier.send_status_notification("Bot started")
+            
+            # Stream candles for the configured pairs (pairs added later are polled)
+            timeframe = self.config["trading"]["timeframe"]
+            for symbol in self.config["trading"]["pairs"]:
+                streams.append(asyncio.create_task(self.data_collector.watch_ohlcv(symbol, timeframe, limit=100)))
+            
+            # Stream tickers and, with API keys, order updates
+            streams.append(asyncio.create_task(self.binance_api.watch_tickers(list(self.config["trading"]["pairs"]))))
+            if self.config["binance"]["api_key"]:
+                streams.append(asyncio.create_task(self.binance_api.watch_orders(list(self.config["trading"]["pairs"]))))
             
             # Main loop
             while not self.stop_event.is_set():
                 try:
-                    # Get trading pairs from config
-                    trading_pairs = self.config["trading"]["pairs"]
+                    # Read the configuration and strategy once per tick (they may be swapped by a /config update)
+                    config = self.config
+                    strategy = self.strategy
+                    trading_pairs = tuple(config["trading"]["pairs"])
+                    short_col = f"ma_{config['indicators']['short_ma_period']}"
+                    long_col = f"ma_{config['indicators']['long_ma_period']}"
                     
                     # Collect data for each trading pair
                     data = {}
-                    for symbol in trading_pairs:
-                        # Get historical data
-                        df = self.data_collector.get_historical_data(
-                            symbol=symbol,
-                            timeframe=self.config["trading"]["timeframe"],
-                            limit=100,
-                        )
-                        
+                    last_values = {}
+                    last_columns = None  # Positions of (close, short MA, long MA, RSI)
+                    for symbol, df in (await self.collect_data(trading_pairs)).items():
                         # Add technical indicators
-                        df_with_indicators = TechnicalIndicators.add_indicators(df, self.config)
+                        df_with_indicators = TechnicalIndicators.add_indicators(df, config)
+                        if df_with_indicators.empty:
+                            logger.warning("No indicator data for %s", symbol)
+                            continue
                         
-                        # Store data
+                        # Store data and the last bar's values (close, short MA, long MA, RSI)
                         data[symbol] = df_with_indicators
+                        if last_columns is None:
+                            last_columns = TechnicalIndicators.column_positions(df_with_indicators, ["close", short_col, long_col, "rsi"])
+                        last_values[symbol] = tuple(df_with_indicators.iloc[-1:, last_columns].to_numpy()[0].tolist())
                     
                     # Generate signals
-                    signals = self.strategy.generate_signals(data)
+                    signals = strategy.generate_signals(data)
                     
                     # Process signals
+                    held_prices = {}
                     for symbol, signal in signals.items():
-                        current_price = data[symbol].iloc[-1]["close"]
+                        current_price, last_short_ma, last_long_ma, last_rsi = last_values[symbol]
                         
                         # Check if we have a position for this symbol
                         position = self.risk_manager.get_position(symbol)
@@ -120,91 +246,184 @@ class TradingBot:
                             # Send notification
                             if self.telegram_notifier:
                                 indicators = {
-                                    "MA(20)": data[symbol].iloc[-1][f"ma_{self.config['indicators']['short_ma_period']}"],
-                                    "MA(50)": data[symbol].iloc[-1][f"ma_{self.config['indicators']['long_ma_period']}"],
-                                    "RSI": data[symbol].iloc[-1]["rsi"],
+                                    "MA(20)": last_short_ma,
+                                    "MA(50)": last_long_ma,
+                                    "RSI": last_rsi,
                                 }
-                                await self.telegram_notifier.send_signal_notification("buy", symbol, current_price, indicators)
-                                await self.telegram_notifier.send_trade_notification("buy", symbol, amount, current_price)
+                                self.telegram_notifier.send_signal_notification("buy", symbol, current_price, indicators)
+                                self.telegram_notifier.send_trade_notification("buy", symbol, amount, current_price)
                         
                         elif signal == -1 and position is not None:
                             # Sell signal and have position
-                            amount = position["amount"]
-                            
-                            # Create sell order
-                            order = self.order_manager.create_sell_order(symbol, amount)
-                            
-                            # Remove position
-                            self.risk_manager.remove_position(symbol)
-                            
-                            # Send notification
-                            if self.telegram_notifier:
-                                indicators = {
-                                    "MA(20)": data[symbol].iloc[-1][f"ma_{self.config['indicators']['short_ma_period']}"],
-                                    "MA(50)": data[symbol].iloc[-1][f"ma_{self.config['indicators']['long_ma_period']}"],
-                                    "RSI": data[symbol].iloc[-1]["rsi"],
-                                }
-                                await self.telegram_notifier.send_signal_notification("sell", symbol, current_price, indicators)
-                                await self.telegram_notifier.send_trade_notification("sell", symbol, amount, current_price)
+                            indicators = {
+                                "MA(20)": last_short_ma,
+                                "MA(50)": last_long_ma,
+                                "RSI": last_rsi,
+                            }
+                            self._close_position(symbol, current_price, indicators=indicators)
                         
                         elif position is not None:
                             # Update position
                             self.risk_manager.update_position(symbol, current_price)
-                            
-                            # Check stop loss and take profit
-                            if self.risk_manager.check_stop_loss(symbol, current_price):
-                                # Stop loss triggered
-                                amount = position["amount"]
-                                
-                                # Create sell order
-                                order = self.order_manager.create_sell_order(symbol, amount)
-                                
-                                # Remove position
-                                self.risk_manager.remove_position(symbol)
-                                
-                                # Send notification
-                                if self.telegram_notifier:
-                                    await self.telegram_notifier.send_status_notification(f"Stop loss triggered for {symbol} at {current_price:.2f}")
-                                    await self.telegram_notifier.send_trade_notification("sell", symbol, amount, current_price)
-                            
-                            elif self.risk_manager.check_take_profit(symbol, current_price):
-                                # Take profit triggered
-                                amount = position["amount"]
-                                
-                                # Create sell order
-                                order = self.order_manager.create_sell_order(symbol, amount)
-                                
-                                # Remove position
-                                self.risk_manager.remove_position(symbol)
-                                
-                                # Send notification
-                                if self.telegram_notifier:
-                                    await self.telegram_notifier.send_status_notification(f"Take profit triggered for {symbol} at {current_price:.2f}")
-                                    await self.telegram_notifier.send_trade_notification("sell", symbol, amount, current_price)
+                            held_prices[symbol] = current_price
+                    
+                    # Check stop loss and take profit of the held positions
+                    for symbol, exit_type in self.risk_manager.check_exits(held_prices).items():
+                        self._close_position(symbol, held_prices[symbol], reason=EXIT_REASONS[exit_type])
                     
-                    # Sleep for a while
-                    await asyncio.sleep(60)  # Sleep for 1 minute
+                    # Wait for the next candle to close, polling at least once a minute
+                    await self._wait_for_candle(60)
                 
                 except Exception as e:
-                    logger.exception(f"Error in main loop: {e}")
+                    logger.exception("Error in main loop: %s", e)
                     if self.telegram_notifier:
-                        await self.telegram_notifier.send_error_notification(f"Error in main loop: {e}")
+                        self.telegram_notifier.send_error_notification(f"Error in main loop: {e}")
                     
                     # Sleep for a while before retrying
-                    await asyncio.sleep(60)  # Sleep for 1 minute
+                    await self._sleep(60)  # Sleep for 1 minute
             
             logger.info("Trading bot stopped")
             if self.telegram_notifier:
-                await self.telegram_notifier.send_status_notification("Bot stopped")
+                self.telegram_notifier.send_status_notification("Bot stopped")
         
         except Exception as e:
-            logger.exception(f"Error running trading bot: {e}")
+            logger.exception("Error running trading bot: %s", e)
             if self.telegram_notifier:
-                await self.telegram_notifier.send_error_notification(f"Error running trading bot: {e}")
+                self.telegram_notifier.send_error_notification(f"Error running trading bot: {e}")
         
         finally:
+            for stream in streams:
+                stream.cancel()
+            await self.data_collector.close()
+            await self.binance_api.close()
+            if self.telegram_notifier:
+                await self.telegram_notifier.aclose()
             self.is_running = False
     
+    async def _wait_for_candle(self, timeout: float) -> None:
+        """
+        Wait until a streamed candle closes, the bot is stopped or the timeout expires.
+        
+        Args:
+            timeout (float): Maximum number of seconds to wait.
+        """
+        candle_closed = self.data_collector.candle_closed
+        waiters = [
+            asyncio.create_task(candle_closed.wait()),
+            asyncio.create_task(self.stop_event.wait()),
+        ]
+        
+        _, pending = await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in pending:
+            waiter.cancel()
+        
+        # Candles closing while this tick is processed wake up the next wait
+        candle_closed.clear()
+    
+    async def _sleep(self, seconds: float) -> None:
+        """
+        Sleep for a number of seconds, or until the bot is stopped.
+        
+        Args:
+            seconds (float): Number of seconds to sleep.
+        """
+        try:
+            await asyncio.wait_for(self.stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+    
+    def _close_position(
+        self,
+        symbol: str,
+        current_price: float,
+        reason: Optional[str] = None,
+        indicators: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Close a position with a market sell order.
+        
+        The Telegram notifications for the sell are queued: a signal
+        notification if `indicators` is given, otherwise a status notification
+        with `reason`, followed by the trade notification.
+        
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            current_price (float): Current price.
+            reason (str, optional): Reason for closing (e.g., 'Stop loss triggered'). Defaults to None.
+            indicators (Dict[str, float], optional): Indicators of the sell signal. Defaults to None.
+        """
+        amount = self.risk_manager.get_position(symbol).amount
+        
+        # Create sell order
+        self.order_manager.create_sell_order(symbol, amount)
+        
+        # Remove position
+        self.risk_manager.remove_position(symbol)
+        
+        # Queue notification
+        if self.telegram_notifier:
+            if indicators is not None:
+                self.telegram_notifier.send_signal_notification("sell", symbol, current_price, indicators)
+            else:
+                self.telegram_notifier.send_status_notification(f"{reason} for {symbol} at {current_price:.2f}")
+            self.telegram_notifier.send_trade_notification("sell", symbol, amount, current_price)
+    
+    async def collect_data(self, trading_pairs: Sequence[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical data for several trading pairs concurrently.
+        
+        Symbols are fetched in batches of FETCH_BATCH_SIZE. Symbols whose fetch
+        fails are logged and left out of the result.
+        
+        Args:
+            trading_pairs (Sequence[str]): Trading pair symbols (e.g., ['BTC/USDT']).
+        
+        Returns:
+            Dict[str, pd.DataFrame]: DataFrames with OHLCV data by symbol.
+        """
+        data = {}
+        timeframe = self.config["trading"]["timeframe"]
+        
+        for start in range(0, len(trading_pairs), FETCH_BATCH_SIZE):
+            if start > 0:
+                await asyncio.sleep(FETCH_BATCH_DELAY)
+            
+            batch = trading_pairs[start:start + FETCH_BATCH_SIZE]
+            results = await asyncio.gather(
+                *[
+                    self.data_collector.get_historical_data_async(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        limit=100,
+                        cached=True,
+                    )
+                    for symbol in batch
+                ],
+                return_exceptions=True,
+            )
+            
+            for symbol, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.error("Error collecting data for %s: %s", symbol, result)
+                    continue
+                data[symbol] = result
+        
+        return data
+    
+    def update_config(self, config: Dict[str, Any]) -> None:
+        """
+        Apply an updated configuration to the running bot.
+        
+        The strategy is rebuilt for the new indicator parameters and the risk
+        manager recomputes its risk parameters, keeping the open positions.
+        
+        Args:
+            config (Dict[str, Any]): Configuration dictionary.
+        """
+        self.strategy = MACrossoverStrategy(config)
+        self.risk_manager.update_config(config)
+        self.config = config
+    
     def stop(self):
         """
         Stop the trading bot.
@@ -231,160 +450,79 @@ class TradingBot:
             initial_balance (float, optional): Initial balance. Defaults to 100.0.
         
         Returns:
-            Dict[str, Any]: Backtest results.
+            Dict[str, Any]: Backtest results. `trades` maps each trade field
+                (type, price, amount, timestamp) to a NumPy array.
         """
         try:
-            logger.info(f"Running backtest for {symbol} from {start_date} to {end_date}")
+            logger.info("Running backtest for %s from %s to %s", symbol, start_date, end_date)
             
             # Convert dates to timestamps
             start_timestamp = int(datetime.fromisoformat(start_date).timestamp() * 1000)
-            end_timestamp = int(datetime.fromisoformat(end_date).timestamp() * 1000)
+            end_bound = _end_bound(end_date)
+            end_timestamp = int(end_bound.timestamp() * 1000)
             
-            # Get historical data
-            df = self.data_collector.get_historical_data(
+            # Get historical data for the whole range
+            df = await self.data_collector.get_range_async(
                 symbol=symbol,
                 timeframe=timeframe,
-                since=start_timestamp,
+                start_ms=start_timestamp,
+                end_ms=end_timestamp,
             )
             
-            # Filter data by date
-            df = df[start_date:end_date]
+            # Filter data by date (binary search on the sorted index)
+            lo = df.index.searchsorted(pd.Timestamp(start_date), side="left")
+            hi = df.index.searchsorted(pd.Timestamp(end_bound), side="left")
+            df = df.iloc[lo:hi]
+            
+            # Read the configuration once
+            config = self.config
             
             # Add technical indicators
-            df_with_indicators = TechnicalIndicators.add_indicators(df, self.config)
+            df_with_indicators = TechnicalIndicators.add_indicators(df, config)
+            
+            short_col = f"ma_{config['indicators']['short_ma_period']}"
+            long_col = f"ma_{config['indicators']['long_ma_period']}"
+            stop_loss_factor = 1 - config["trading"]["stop_loss_percentage"] / 100
+            take_profit_factor = 1 + config["trading"]["take_profit_percentage"] / 100
             
-            # Initialize backtest variables
-            balance = initial_balance
-            position = None
-            trades = []
+            # Extract indicator columns as NumPy arrays
+            short_ma = df_with_indicators[short_col].to_numpy()
+            long_ma = df_with_indicators[long_col].to_numpy()
+            rsi = df_with_indicators["rsi"].to_numpy()
+            close = df_with_indicators["close"].to_numpy()
+            timestamps = df_with_indicators.index
+            
+            # Vectorized crossovers (bar i compares against bar i-1, so bar 0 never signals)
+            crossovers = TechnicalIndicators.crossover_signals(short_ma, long_ma)
+            
+            # Vectorized signals
+            buy_signal = (crossovers == 1) & (rsi >= 30) & (rsi <= 50)
+            sell_signal = (crossovers == -1) | (rsi >= 70)
+            sell_signal[:1] = False
             
             # Run backtest
-            for i in range(1, len(df_with_indicators)):
-                # Get current row
-                row = df_with_indicators.iloc[i]
-                prev_row = df_with_indicators.iloc[i-1]
-                
-                # Get current price
-                current_price = row["close"]
-                
-                # Check for buy signal
-                if (prev_row[f"ma_{self.config['indicators']['short_ma_period']}"] <= prev_row[f"ma_{self.config['indicators']['long_ma_period']}"] and
-                    row[f"ma_{self.config['indicators']['short_ma_period']}"] > row[f"ma_{self.config['indicators']['long_ma_period']}"]) and \
-                   (row["rsi"] >= 30 and row["rsi"] <= 50) and \
-                   position is None:
-                    # Buy signal
-                    amount = (balance * 0.95) / current_price  # Use 95% of balance
-                    cost = amount * current_price
-                    balance -= cost
-                    
-                    # Create position
-                    position = {
-                        "symbol": symbol,
-                        "amount": amount,
-                        "entry_price": current_price,
-                        "timestamp": row.name.isoformat(),
-                    }
-                    
-                    # Add trade
-                    trades.append({
-                        "id": str(len(trades) + 1),
-                        "symbol": symbol,
-                        "type": "buy",
-                        "price": current_price,
-                        "amount": amount,
-                        "timestamp": row.name.isoformat(),
-                        "status": "completed",
-                    })
-                
-                # Check for sell signal
-                elif ((prev_row[f"ma_{self.config['indicators']['short_ma_period']}"] >= prev_row[f"ma_{self.config['indicators']['long_ma_period']}"] and
-                       row[f"ma_{self.config['indicators']['short_ma_period']}"] < row[f"ma_{self.config['indicators']['long_ma_period']}"]) or \
-                      row["rsi"] >= 70) and \
-                     position is not None:
-                    # Sell signal
-                    amount = position["amount"]
-                    revenue = amount * current_price
-                    balance += revenue
-                    
-                    # Add trade
-                    trades.append({
-                        "id": str(len(trades) + 1),
-                        "symbol": symbol,
-                        "type": "sell",
-                        "price": current_price,
-                        "amount": amount,
-                        "timestamp": row.name.isoformat(),
-                        "status": "completed",
-                    })
-                    
-                    # Clear position
-                    position = None
-                
-                # Check for stop loss
-                elif position is not None and current_price <= position["entry_price"] * (1 - self.config["trading"]["stop_loss_percentage"] / 100):
-                    # Stop loss triggered
-                    amount = position["amount"]
-                    revenue = amount * current_price
-                    balance += revenue
-                    
-                    # Add trade
-                    trades.append({
-                        "id": str(len(trades) + 1),
-                        "symbol": symbol,
-                        "type": "sell",
-                        "price": current_price,
-                        "amount": amount,
-                        "timestamp": row.name.isoformat(),
-                        "status": "completed",
-                    })
-                    
-                    # Clear position
-                    position = None
-                
-                # Check for take profit
-                elif position is not None and current_price >= position["entry_price"] * (1 + self.config["trading"]["take_profit_percentage"] / 100):
-                    # Take profit triggered
-                    amount = position["amount"]
-                    revenue = amount * current_price
-                    balance += revenue
-                    
-                    # Add trade
-                    trades.append({
-                        "id": str(len(trades) + 1),
-                        "symbol": symbol,
-                        "type": "sell",
-                        "price": current_price,
-                        "amount": amount,
-                        "timestamp": row.name.isoformat(),
-                        "status": "completed",
-                    })
-                    
-                    # Clear position
-                    position = None
+            balance, trade_prices, trade_amounts, trade_types, trade_idx, n_trades = _run_backtest(
+                np.ascontiguousarray(close, dtype=np.float64),
+                buy_signal,
+                sell_signal,
+                float(stop_loss_factor),
+                float(take_profit_factor),
+                float(initial_balance),
+            )
             
-            # Sell any remaining position at the last price
-            if position is not None:
-                amount = position["amount"]
-                last_price = df_with_indicators.iloc[-1]["close"]
-                revenue = amount * last_price
-                balance += revenue
-                
-                # Add trade
-                trades.append({
-                    "id": str(len(trades) + 1),
-                    "symbol": symbol,
-                    "type": "sell",
-                    "price": last_price,
-                    "amount": amount,
-                    "timestamp": df_with_indicators.index[-1].isoformat(),
-                    "status": "completed",
-                })
+            # Trade log as columns (pd.DataFrame(result["trades"]) builds a frame in one call)
+            trades = {
+                "type": np.where(trade_types[:n_trades] == 0, "buy", "sell"),
+                "price": trade_prices[:n_trades],
+                "amount": trade_amounts[:n_trades],
+                "timestamp": np.datetime_as_string(timestamps.to_numpy()[trade_idx[:n_trades]], unit="s"),
+            }
             
             # Calculate profit/loss
             profit_loss = balance - initial_balance
             profit_loss_percentage = (profit_loss / initial_balance) * 100
             
-            logger.info(f"Backtest completed: Balance: ${balance:.2f}, P/L: ${profit_loss:.2f} ({profit_loss_percentage:.2f}%)")
+            logger.info("Backtest completed: Balance: $%.2f, P/L: $%.2f (%.2f%%)", balance, profit_loss, profit_loss_percentage)
             
             return {
                 "symbol": symbol,
@@ -399,5 +537,5 @@ class TradingBot:
             }
         
         except Exception as e:
-            logger.exception(f"Error running backtest: {e}")
+            logger.exception("Error running backtest: %s", e)
             raise
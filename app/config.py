@@ -5,7 +5,7 @@ This module loads configuration from the .env file and provides it to the rest o
 """
 
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -33,6 +33,9 @@ RSI_SELL_THRESHOLD = float(os.getenv("RSI_SELL_THRESHOLD", "70"))
 # Telegram Configuration
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
+TELEGRAM_BATCH_FLUSH_INTERVAL = float(os.getenv("TELEGRAM_BATCH_FLUSH_INTERVAL", "3"))  # Seconds to collect messages before sending them
+TELEGRAM_MAX_BUFFER_SIZE = int(os.getenv("TELEGRAM_MAX_BUFFER_SIZE", "4096"))  # Maximum length of a sent message
+TELEGRAM_POOL_SIZE = int(os.getenv("TELEGRAM_POOL_SIZE", "32"))  # Keep-alive connections to the Telegram Bot API
 
 # Database Configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./trading_bot.db")
@@ -40,6 +43,7 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./trading_bot.db")
 # API Configuration
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
 API_PORT = int(os.getenv("API_PORT", "8000"))
+API_RELOAD = os.getenv("API_RELOAD", "false").lower() == "true"  # Auto-reload on code changes (development only)
 
 # Timeframe for data collection (in minutes)
 TIMEFRAME = os.getenv("TIMEFRAME", "15m")  # 15 minutes by default
@@ -75,6 +79,9 @@ def get_config() -> Dict[str, Any]:
         "telegram": {
             "bot_token": TELEGRAM_BOT_TOKEN,
             "chat_id": TELEGRAM_CHAT_ID,
+            "batch_flush_interval": TELEGRAM_BATCH_FLUSH_INTERVAL,
+            "max_buffer_size": TELEGRAM_MAX_BUFFER_SIZE,
+            "pool_size": TELEGRAM_POOL_SIZE,
         },
         "database": {
             "url": DATABASE_URL,
@@ -82,23 +89,26 @@ def get_config() -> Dict[str, Any]:
         "api": {
             "host": API_HOST,
             "port": API_PORT,
+            "reload": API_RELOAD,
         },
     }
 
-def validate_config() -> bool:
+def validate_config() -> Tuple[bool, Dict[str, Any]]:
     """
     Validate the configuration.
     
     Returns:
-        bool: True if the configuration is valid, False otherwise.
+        Tuple[bool, Dict[str, Any]]: True if the configuration is valid (False otherwise), and the configuration dictionary.
     """
+    config = get_config()
+    
     # Check if Binance API keys are set
-    if not BINANCE_API_KEY or not BINANCE_API_SECRET:
+    if not config["binance"]["api_key"] or not config["binance"]["api_secret"]:
         print("Warning: Binance API keys are not set. The bot will not be able to trade.")
-        return False
+        return False, config
     
     # Check if Telegram configuration is set
-    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
+    if not config["telegram"]["bot_token"] or not config["telegram"]["chat_id"]:
         print("Warning: Telegram configuration is not set. The bot will not be able to send notifications.")
     
-    return True
+    return True, config
@@ -5,14 +5,65 @@ This module is responsible for collecting data from Binance.
 """
 
 import logging
+import asyncio
+import numpy as np
 import pandas as pd
 import ccxt
-from typing import Dict, List, Any, Optional
+import ccxt.pro as ccxtpro
+import orjson
+from typing import Dict, List, Any, Optional, Set, Tuple
 import time
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Candles per OHLCV request and concurrent requests for range fetches (Binance limits)
+RANGE_PAGE_SIZE = 1000
+RANGE_CONCURRENCY = 5
+
+# Pause before reconnecting a failed OHLCV stream, in seconds
+STREAM_RETRY_DELAY = 5
+
+def _ohlcv_to_frame(ohlcv: List[List[float]]) -> pd.DataFrame:
+    """
+    Convert raw OHLCV candles to a DataFrame.
+    
+    Args:
+        ohlcv (List[List[float]]): Candles as [timestamp, open, high, low, close, volume].
+    
+    Returns:
+        pd.DataFrame: DataFrame with OHLCV data indexed by the candle timestamp.
+    """
+    # Convert to a float array in one pass
+    arr = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+    
+    # Convert to DataFrame indexed by the candle timestamp
+    index = pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms')
+    index.name = 'timestamp'
+    return pd.DataFrame(
+        arr[:, 1:],
+        columns=['open', 'high', 'low', 'close', 'volume'],
+        index=index,
+    )
+
+def _parse_json(http_response: str) -> Any:
+    """
+    Parse a JSON response body with orjson.
+    
+    Drop-in replacement for ccxt's Exchange.parse_json, which uses the json module.
+    
+    Args:
+        http_response (str): Response body.
+    
+    Returns:
+        Any: Decoded response, or None if the body is not JSON.
+    """
+    try:
+        if ccxt.Exchange.is_json_encoded_object(http_response):
+            return orjson.loads(http_response)
+    except orjson.JSONDecodeError:
+        pass
+
 class BinanceDataCollector:
     """
     Data collector for Binance.
@@ -28,19 +79,34 @@ class BinanceDataCollector:
             api_key (str, optional): Binance API key. Defaults to None.
             api_secret (str, optional): Binance API secret. Defaults to None.
         """
-        self.exchange = ccxt.binance({
+        exchange_config = {
             'apiKey': api_key,
             'secret': api_secret,
             'enableRateLimit': True,
             'options': {
                 'defaultType': 'spot',
             },
-        })
+        }
+        self.exchange = ccxt.binance(exchange_config)
+        
+        # WebSocket exchange for real-time candles
+        self.stream_exchange = ccxtpro.binance(exchange_config)
+        
+        # Decode the (large) OHLCV payloads with orjson
+        self.exchange.parse_json = _parse_json
+        self.stream_exchange.parse_json = _parse_json
         
         # Check if the exchange is available
         if not self.exchange.has['fetchOHLCV']:
             raise Exception("Exchange does not support OHLCV data")
         
+        # Cached OHLCV data by (symbol, timeframe)
+        self._cache: Dict[Tuple[str, str], pd.DataFrame] = {}
+        
+        # Cache keys kept up to date by a live stream, and the event set when a candle closes
+        self._streamed: Set[Tuple[str, str]] = set()
+        self.candle_closed = asyncio.Event()
+        
         logger.info("Binance data collector initialized")
     
     def get_historical_data(
@@ -72,16 +138,7 @@ class BinanceDataCollector:
             )
             
             # Convert to DataFrame
-            df = pd.DataFrame(
-                ohlcv,
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'],
-            )
-            
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            
-            # Set timestamp as index
-            df.set_index('timestamp', inplace=True)
+            df = _ohlcv_to_frame(ohlcv)
             
             logger.info(f"Fetched {len(df)} candles for {symbol} ({timeframe})")
             
@@ -90,6 +147,192 @@ class BinanceDataCollector:
             logger.exception(f"Error fetching historical data: {e}")
             raise
     
+    def get_historical_data_cached(
+        self,
+        symbol: str,
+        timeframe: str = '15m',
+        limit: int = 100,
+    ) -> pd.DataFrame:
+        """
+        Get the latest OHLCV data from Binance, fetching only new candles.
+        
+        The first call fetches `limit` candles. Later calls only fetch from the
+        last cached candle onwards (which is refetched, since it may still be
+        forming), merge the result into the cache and keep the last `limit` candles.
+        While the symbol is streamed by watch_ohlcv, the cache is returned as is.
+        
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            timeframe (str, optional): Timeframe. Defaults to '15m'.
+            limit (int, optional): Number of candles to return. Defaults to 100.
+        
+        Returns:
+            pd.DataFrame: DataFrame with OHLCV data.
+        """
+        key = (symbol, timeframe)
+        cached = self._cache.get(key)
+        
+        if key in self._streamed and len(cached) >= limit:
+            return cached
+        
+        if cached is None or len(cached) < limit:
+            df = self.get_historical_data(symbol=symbol, timeframe=timeframe, limit=limit)
+        else:
+            since = int(cached.index[-1].timestamp() * 1000)
+            new_df = self.get_historical_data(symbol=symbol, timeframe=timeframe, limit=limit, since=since)
+            
+            if len(new_df) >= limit:
+                # The cache is too far behind to be merged, refetch the latest candles
+                df = self.get_historical_data(symbol=symbol, timeframe=timeframe, limit=limit)
+            else:
+                df = self._merge(cached, new_df, limit)
+        
+        self._cache[key] = df
+        
+        return df
+    
+    @staticmethod
+    def _merge(cached: pd.DataFrame, new_df: pd.DataFrame, limit: int) -> pd.DataFrame:
+        """
+        Merge fresh candles into cached OHLCV data.
+        
+        Args:
+            cached (pd.DataFrame): Cached OHLCV data.
+            new_df (pd.DataFrame): Fresh OHLCV data, starting at or after the last cached candle.
+            limit (int): Number of candles to keep.
+        
+        Returns:
+            pd.DataFrame: Merged OHLCV data.
+        """
+        # Replace the overlapping candles with the fresh ones
+        if len(new_df) > 0:
+            cached = cached[cached.index < new_df.index[0]]
+        return pd.concat([cached, new_df]).iloc[-limit:]
+    
+    async def watch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = '15m',
+        limit: int = 100,
+    ) -> None:
+        """
+        Stream OHLCV data from the Binance WebSocket into the cache.
+        
+        The cache is seeded with a REST fetch, then every pushed candle is
+        merged into it, so get_historical_data_cached no longer polls for this
+        symbol. `candle_closed` is set whenever a new candle opens. Runs until
+        cancelled, reconnecting after errors.
+        
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            timeframe (str, optional): Timeframe. Defaults to '15m'.
+            limit (int, optional): Number of candles to keep. Defaults to 100.
+        """
+        key = (symbol, timeframe)
+        
+        while True:
+            try:
+                # Seed the cache, candles missed while disconnected are fetched here too
+                await asyncio.to_thread(self.get_historical_data_cached, symbol, timeframe, limit)
+                
+                while True:
+                    candles = await self.stream_exchange.watch_ohlcv(symbol, timeframe)
+                    new_df = _ohlcv_to_frame(candles)
+                    cached = self._cache[key]
+                    
+                    if new_df.index[-1] > cached.index[-1]:
+                        self.candle_closed.set()
+                    
+                    self._cache[key] = self._merge(cached, new_df[new_df.index >= cached.index[-1]], limit)
+                    self._streamed.add(key)
+            except Exception as e:
+                self._streamed.discard(key)
+                logger.exception(f"Error streaming OHLCV data for {symbol}: {e}")
+                await asyncio.sleep(STREAM_RETRY_DELAY)
+    
+    async def close(self) -> None:
+        """
+        Close the WebSocket connections.
+        """
+        self._streamed.clear()
+        await self.stream_exchange.close()
+    
+    async def get_historical_data_async(
+        self,
+        symbol: str,
+        timeframe: str = '15m',
+        limit: int = 100,
+        cached: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Get historical OHLCV data from Binance without blocking the event loop.
+        
+        The blocking ccxt request runs in a worker thread, so several symbols
+        can be fetched concurrently.
+        
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            timeframe (str, optional): Timeframe. Defaults to '15m'.
+            limit (int, optional): Number of candles to fetch. Defaults to 100.
+            cached (bool, optional): Use get_historical_data_cached. Defaults to False.
+        
+        Returns:
+            pd.DataFrame: DataFrame with OHLCV data.
+        """
+        return await asyncio.to_thread(
+            self.get_historical_data_cached if cached else self.get_historical_data,
+            symbol=symbol,
+            timeframe=timeframe,
+            limit=limit,
+        )
+    
+    async def get_range_async(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ms: int,
+        end_ms: int,
+    ) -> pd.DataFrame:
+        """
+        Get historical OHLCV data for a time range from Binance.
+        
+        The range is split into pages of RANGE_PAGE_SIZE candles which are
+        fetched concurrently, at most RANGE_CONCURRENCY at a time.
+        
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            timeframe (str): Timeframe.
+            start_ms (int): Start timestamp in milliseconds (inclusive).
+            end_ms (int): End timestamp in milliseconds (exclusive).
+        
+        Returns:
+            pd.DataFrame: DataFrame with OHLCV data.
+        """
+        step_ms = self.exchange.parse_timeframe(timeframe) * 1000 * RANGE_PAGE_SIZE
+        semaphore = asyncio.Semaphore(RANGE_CONCURRENCY)
+        
+        async def fetch_page(since: int) -> pd.DataFrame:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.get_historical_data,
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    limit=RANGE_PAGE_SIZE,
+                    since=since,
+                )
+        
+        # Always fetch at least one page, so an empty range still yields a well-formed frame
+        starts = range(start_ms, max(end_ms, start_ms + 1), step_ms)
+        pages = await asyncio.gather(*[fetch_page(since) for since in starts])
+        
+        df = pd.concat(pages)
+        df = df[~df.index.duplicated(keep='first')]
+        df = df[df.index < pd.Timestamp(end_ms, unit='ms')]
+        
+        logger.info(f"Fetched {len(df)} candles for {symbol} ({timeframe}) in {len(pages)} pages")
+        
+        return df
+    
     def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """
         Get current ticker data from Binance.
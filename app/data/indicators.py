@@ -5,19 +5,171 @@ This module is responsible for calculating technical indicators.
 """
 
 import logging
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
-from typing import Dict, Any
+from typing import Dict, Any, List
+from numba import njit
 
 logger = logging.getLogger(__name__)
 
+# MACD and Bollinger Bands parameters (pandas_ta defaults)
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+BBANDS_LENGTH = 5
+BBANDS_STD = 2.0
+
+@njit(cache=True, error_model="numpy")
+def _compute_indicators(
+    close: np.ndarray,
+    short_ma_period: int,
+    long_ma_period: int,
+    rsi_period: int,
+    ma_short: np.ndarray,
+    ma_long: np.ndarray,
+    rsi: np.ndarray,
+    macd: np.ndarray,
+    macd_hist: np.ndarray,
+    macd_signal: np.ndarray,
+    bb_lower: np.ndarray,
+    bb_mid: np.ndarray,
+    bb_upper: np.ndarray,
+    bb_bandwidth: np.ndarray,
+    bb_percent: np.ndarray,
+):
+    """
+    Compute all indicators in a single pass over the close prices.
+    
+    The results match pandas_ta's sma, rsi, macd and bbands: SMAs, RSI from
+    (adjusted) exponential averages of gains and losses with alpha = 1 / period,
+    MACD from SMA-seeded EMAs and Bollinger Bands from the population standard
+    deviation. Bars before an indicator's warm-up are NaN.
+    
+    Args:
+        close (np.ndarray): Close prices.
+        short_ma_period (int): Short MA period.
+        long_ma_period (int): Long MA period.
+        rsi_period (int): RSI period.
+        ma_short (np.ndarray): Output short MA.
+        ma_long (np.ndarray): Output long MA.
+        rsi (np.ndarray): Output RSI.
+        macd (np.ndarray): Output MACD line.
+        macd_hist (np.ndarray): Output MACD histogram.
+        macd_signal (np.ndarray): Output MACD signal line.
+        bb_lower (np.ndarray): Output lower Bollinger Band.
+        bb_mid (np.ndarray): Output middle Bollinger Band.
+        bb_upper (np.ndarray): Output upper Bollinger Band.
+        bb_bandwidth (np.ndarray): Output Bollinger bandwidth.
+        bb_percent (np.ndarray): Output Bollinger %B.
+    """
+    n = len(close)
+    
+    short_sum = 0.0
+    long_sum = 0.0
+    
+    # Exponential averages of gains and losses (numerators and shared weight)
+    rsi_decay = 1.0 - 1.0 / rsi_period
+    gain_num = 0.0
+    loss_num = 0.0
+    rsi_weight = 0.0
+    
+    fast_alpha = 2.0 / (MACD_FAST + 1)
+    slow_alpha = 2.0 / (MACD_SLOW + 1)
+    signal_alpha = 2.0 / (MACD_SIGNAL + 1)
+    fast_ema = 0.0
+    slow_ema = 0.0
+    signal_ema = 0.0
+    signal_start = MACD_SLOW - 1 + MACD_SIGNAL - 1
+    
+    for i in range(n):
+        price = close[i]
+        
+        # Moving averages (running sums over the window)
+        short_sum += price
+        long_sum += price
+        if i >= short_ma_period:
+            short_sum -= close[i - short_ma_period]
+        if i >= long_ma_period:
+            long_sum -= close[i - long_ma_period]
+        ma_short[i] = short_sum / short_ma_period if i >= short_ma_period - 1 else np.nan
+        ma_long[i] = long_sum / long_ma_period if i >= long_ma_period - 1 else np.nan
+        
+        # RSI
+        if i >= 1:
+            diff = price - close[i - 1]
+            gain_num = max(diff, 0.0) + rsi_decay * gain_num
+            loss_num = max(-diff, 0.0) + rsi_decay * loss_num
+            rsi_weight = 1.0 + rsi_decay * rsi_weight
+        if i >= rsi_period:
+            avg_gain = gain_num / rsi_weight
+            avg_loss = loss_num / rsi_weight
+            rsi[i] = 100.0 * avg_gain / (avg_gain + avg_loss)
+        else:
+            rsi[i] = np.nan
+        
+        # MACD (EMAs seeded with the SMA of their first window)
+        if i == MACD_FAST - 1:
+            fast_ema = close[:MACD_FAST].mean()
+        elif i >= MACD_FAST:
+            fast_ema = fast_alpha * price + (1.0 - fast_alpha) * fast_ema
+        if i == MACD_SLOW - 1:
+            slow_ema = close[:MACD_SLOW].mean()
+        elif i >= MACD_SLOW:
+            slow_ema = slow_alpha * price + (1.0 - slow_alpha) * slow_ema
+        macd[i] = fast_ema - slow_ema if i >= MACD_SLOW - 1 else np.nan
+        if i == signal_start:
+            signal_ema = macd[MACD_SLOW - 1:i + 1].mean()
+        elif i > signal_start:
+            signal_ema = signal_alpha * macd[i] + (1.0 - signal_alpha) * signal_ema
+        macd_signal[i] = signal_ema if i >= signal_start else np.nan
+        macd_hist[i] = macd[i] - macd_signal[i]
+        
+        # Bollinger Bands (the window is short, so its mean and deviation are computed directly)
+        if i >= BBANDS_LENGTH - 1:
+            window = close[i - BBANDS_LENGTH + 1:i + 1]
+            mid = window.mean()
+            std = np.sqrt(((window - mid) ** 2).mean())
+            lower = mid - BBANDS_STD * std
+            upper = mid + BBANDS_STD * std
+            bb_lower[i] = lower
+            bb_mid[i] = mid
+            bb_upper[i] = upper
+            bb_bandwidth[i] = 100.0 * (upper - lower) / mid
+            bb_percent[i] = (price - lower) / (upper - lower)
+        else:
+            bb_lower[i] = np.nan
+            bb_mid[i] = np.nan
+            bb_upper[i] = np.nan
+            bb_bandwidth[i] = np.nan
+            bb_percent[i] = np.nan
+
 class TechnicalIndicators:
     """
     Technical indicators calculator.
     
-    This class is responsible for calculating technical indicators.
+    This class is responsible for calculating technical indicators. Signals
+    are computed with the indicator parameters of the configuration it was
+    created with.
     """
     
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize the technical indicators calculator.
+        
+        Args:
+            config (Dict[str, Any]): Configuration dictionary.
+        """
+        self.config = config
+        
+        # Get indicator parameters from config
+        self.short_ma_col = f"ma_{config['indicators']['short_ma_period']}"
+        self.long_ma_col = f"ma_{config['indicators']['long_ma_period']}"
+        self.rsi_buy_threshold = config["indicators"]["rsi_buy_threshold"]
+        self.rsi_sell_threshold = config["indicators"]["rsi_sell_threshold"]
+        
+        # Columns read by the signals
+        self.signal_columns = [self.short_ma_col, self.long_ma_col, "rsi"]
+    
     @staticmethod
     def add_indicators(df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
         """
@@ -31,148 +183,276 @@ class TechnicalIndicators:
             pd.DataFrame: DataFrame with technical indicators.
         """
         try:
-            # Make a copy of the DataFrame to avoid modifying the original
-            df_with_indicators = df.copy()
+            # Make a shallow copy of the DataFrame (indicators are added as new columns)
+            df_with_indicators = df.copy(deep=False)
             
             # Get indicator parameters from config
             short_ma_period = config["indicators"]["short_ma_period"]
             long_ma_period = config["indicators"]["long_ma_period"]
             rsi_period = config["indicators"]["rsi_period"]
             
-            # Calculate Moving Averages
-            df_with_indicators[f'ma_{short_ma_period}'] = ta.sma(df_with_indicators['close'], length=short_ma_period)
-            df_with_indicators[f'ma_{long_ma_period}'] = ta.sma(df_with_indicators['close'], length=long_ma_period)
+            # Output columns (named as by pandas_ta)
+            macd_suffix = f"{MACD_FAST}_{MACD_SLOW}_{MACD_SIGNAL}"
+            bbands_suffix = f"{BBANDS_LENGTH}_{BBANDS_STD}"
             
-            # Calculate RSI
-            df_with_indicators['rsi'] = ta.rsi(df_with_indicators['close'], length=rsi_period)
+            # Contiguous float64 close (a column of a 2D OHLCV block is strided)
+            close = np.ascontiguousarray(df_with_indicators['close'].to_numpy(dtype=np.float64))
+            names = (
+                f'ma_{short_ma_period}',
+                f'ma_{long_ma_period}',
+                'rsi',
+                f'MACD_{macd_suffix}',
+                f'MACDh_{macd_suffix}',
+                f'MACDs_{macd_suffix}',
+                f'BBL_{bbands_suffix}',
+                f'BBM_{bbands_suffix}',
+                f'BBU_{bbands_suffix}',
+                f'BBB_{bbands_suffix}',
+                f'BBP_{bbands_suffix}',
+            )
+            # One column-major buffer for all indicators, each column is contiguous
+            buf = np.empty((len(close), len(names)), dtype=np.float64, order='F')
             
-            # Calculate MACD
-            macd = ta.macd(df_with_indicators['close'])
-            df_with_indicators = pd.concat([df_with_indicators, macd], axis=1)
+            # Calculate Moving Averages, RSI, MACD and Bollinger Bands
+            _compute_indicators(close, short_ma_period, long_ma_period, rsi_period, *buf.T)
             
-            # Calculate Bollinger Bands
-            bbands = ta.bbands(df_with_indicators['close'])
-            df_with_indicators = pd.concat([df_with_indicators, bbands], axis=1)
+            for name, values in zip(names, buf.T):
+                df_with_indicators[name] = values
             
-            # Drop NaN values
-            df_with_indicators.dropna(inplace=True)
+            # Drop the warm-up bars, where some indicator is not yet defined
+            warmup = max(
+                short_ma_period - 1,
+                long_ma_period - 1,
+                rsi_period,
+                MACD_SLOW + MACD_SIGNAL - 2,
+                BBANDS_LENGTH - 1,
+            )
+            df_with_indicators = df_with_indicators.iloc[warmup:]
             
-            logger.info(f"Added technical indicators to DataFrame with {len(df_with_indicators)} rows")
+            logger.info("Added technical indicators to DataFrame with %s rows", len(df_with_indicators))
             
             return df_with_indicators
         except Exception as e:
-            logger.exception(f"Error adding technical indicators: {e}")
+            logger.exception("Error adding technical indicators: %s", e)
             raise
     
     @staticmethod
-    def get_ma_crossover_signal(df: pd.DataFrame, config: Dict[str, Any]) -> int:
+    def column_positions(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """
+        Get the positions of some columns.
+        
+        Args:
+            df (pd.DataFrame): DataFrame with technical indicators.
+            columns (List[str]): Column names.
+        
+        Returns:
+            np.ndarray: Position of each column.
+        
+        Raises:
+            KeyError: If a column is missing (get_indexer would return -1, which iloc reads as the last column).
+        """
+        positions = df.columns.get_indexer(columns)
+        if (positions < 0).any():
+            missing = [column for column, position in zip(columns, positions) if position < 0]
+            raise KeyError(f"Missing indicator columns: {missing}")
+        return positions
+    
+    @staticmethod
+    def _last_rows(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """
+        Get the values of the last two rows of some columns.
+        
+        The columns are resolved to positions in one lookup and read with a
+        positional slice, so no row Series is built.
+        
+        Args:
+            df (pd.DataFrame): DataFrame with technical indicators.
+            columns (List[str]): Column names.
+        
+        Returns:
+            np.ndarray: Values with shape (2, len(columns)).
+        """
+        return df.iloc[-2:, TechnicalIndicators.column_positions(df, columns)].to_numpy()
+    
+    @staticmethod
+    def crossover_signals(short_ma: np.ndarray, long_ma: np.ndarray) -> np.ndarray:
+        """
+        Get the Moving Average crossover signal of every bar.
+        
+        Args:
+            short_ma (np.ndarray): Short MA.
+            long_ma (np.ndarray): Long MA.
+        
+        Returns:
+            np.ndarray: Signal of each bar as int8 (1 for buy, -1 for sell, 0 for
+                no signal). The first bar has no previous bar and never signals.
+        """
+        # Crossovers are sign changes of the MA spread against the previous bar
+        spread = short_ma - long_ma
+        bullish = (spread[:-1] <= 0) & (spread[1:] > 0)
+        bearish = (spread[:-1] >= 0) & (spread[1:] < 0)
+        
+        signals = np.zeros(len(short_ma), dtype=np.int8)
+        signals[1:] = bullish.astype(np.int8) - bearish.astype(np.int8)
+        return signals
+    
+    @staticmethod
+    def _crossover(prev_short_ma: float, prev_long_ma: float, last_short_ma: float, last_long_ma: float) -> int:
+        """
+        Get the Moving Average crossover between two bars.
+        
+        Args:
+            prev_short_ma (float): Short MA of the previous bar.
+            prev_long_ma (float): Long MA of the previous bar.
+            last_short_ma (float): Short MA of the last bar.
+            last_long_ma (float): Long MA of the last bar.
+        
+        Returns:
+            int: Signal (1 for buy, -1 for sell, 0 for no signal).
+        """
+        if prev_short_ma <= prev_long_ma and last_short_ma > last_long_ma:
+            # Bullish crossover (short MA crosses above long MA)
+            return 1
+        elif prev_short_ma >= prev_long_ma and last_short_ma < last_long_ma:
+            # Bearish crossover (short MA crosses below long MA)
+            return -1
+        else:
+            # No crossover
+            return 0
+    
+    def _rsi_level(self, rsi: float) -> int:
+        """
+        Get the RSI signal of a bar.
+        
+        Args:
+            rsi (float): RSI of the bar.
+        
+        Returns:
+            int: Signal (1 for buy, -1 for sell, 0 for no signal).
+        """
+        if rsi < self.rsi_buy_threshold:
+            # RSI is below buy threshold (oversold)
+            return 1
+        elif rsi > self.rsi_sell_threshold:
+            # RSI is above sell threshold (overbought)
+            return -1
+        else:
+            # RSI is in the middle
+            return 0
+    
+    def get_ma_crossover_signal(self, df: pd.DataFrame) -> int:
         """
         Get Moving Average crossover signal.
         
         Args:
             df (pd.DataFrame): DataFrame with technical indicators.
-            config (Dict[str, Any]): Configuration dictionary.
         
         Returns:
             int: Signal (1 for buy, -1 for sell, 0 for no signal).
         """
         try:
-            # Get indicator parameters from config
-            short_ma_period = config["indicators"]["short_ma_period"]
-            long_ma_period = config["indicators"]["long_ma_period"]
+            # Get the short and long MA of the last two rows
+            (prev_short_ma, prev_long_ma), (last_short_ma, last_long_ma) = (
+                self._last_rows(df, self.signal_columns[:2])
+            )
             
-            # Get the last two rows
-            last_row = df.iloc[-1]
-            prev_row = df.iloc[-2]
-            
-            # Check for crossover
-            if (prev_row[f'ma_{short_ma_period}'] <= prev_row[f'ma_{long_ma_period}'] and
-                last_row[f'ma_{short_ma_period}'] > last_row[f'ma_{long_ma_period}']):
-                # Bullish crossover (short MA crosses above long MA)
-                return 1
-            elif (prev_row[f'ma_{short_ma_period}'] >= prev_row[f'ma_{long_ma_period}'] and
-                  last_row[f'ma_{short_ma_period}'] < last_row[f'ma_{long_ma_period}']):
-                # Bearish crossover (short MA crosses below long MA)
-                return -1
-            else:
-                # No crossover
-                return 0
+            return self._crossover(prev_short_ma, prev_long_ma, last_short_ma, last_long_ma)
         except Exception as e:
-            logger.exception(f"Error getting MA crossover signal: {e}")
+            logger.exception("Error getting MA crossover signal: %s", e)
             raise
     
-    @staticmethod
-    def get_rsi_signal(df: pd.DataFrame, config: Dict[str, Any]) -> int:
+    def get_rsi_signal(self, df: pd.DataFrame) -> int:
         """
         Get RSI signal.
         
         Args:
             df (pd.DataFrame): DataFrame with technical indicators.
-            config (Dict[str, Any]): Configuration dictionary.
         
         Returns:
             int: Signal (1 for buy, -1 for sell, 0 for no signal).
         """
         try:
-            # Get indicator parameters from config
-            rsi_buy_threshold = config["indicators"]["rsi_buy_threshold"]
-            rsi_sell_threshold = config["indicators"]["rsi_sell_threshold"]
-            
-            # Get the last row
-            last_row = df.iloc[-1]
-            
-            # Check RSI value
-            if last_row['rsi'] < rsi_buy_threshold:
-                # RSI is below buy threshold (oversold)
-                return 1
-            elif last_row['rsi'] > rsi_sell_threshold:
-                # RSI is above sell threshold (overbought)
-                return -1
-            else:
-                # RSI is in the middle
-                return 0
+            return self._rsi_level(df["rsi"].iat[-1])
         except Exception as e:
-            logger.exception(f"Error getting RSI signal: {e}")
+            logger.exception("Error getting RSI signal: %s", e)
             raise
     
-    @staticmethod
-    def get_combined_signal(df: pd.DataFrame, config: Dict[str, Any]) -> int:
+    def get_combined_signal(self, df: pd.DataFrame) -> int:
         """
         Get combined signal from multiple indicators.
         
         Args:
             df (pd.DataFrame): DataFrame with technical indicators.
-            config (Dict[str, Any]): Configuration dictionary.
         
         Returns:
             int: Signal (1 for buy, -1 for sell, 0 for no signal).
         """
         try:
-            # Get individual signals
-            ma_signal = TechnicalIndicators.get_ma_crossover_signal(df, config)
-            rsi_signal = TechnicalIndicators.get_rsi_signal(df, config)
-            
-            # Get the last row
-            last_row = df.iloc[-1]
+            # Get the signal columns of the last two rows
+            (prev_short_ma, prev_long_ma, _), (last_short_ma, last_long_ma, last_rsi) = (
+                self._last_rows(df, self.signal_columns)
+            )
             
-            # Get indicator parameters from config
-            short_ma_period = config["indicators"]["short_ma_period"]
-            long_ma_period = config["indicators"]["long_ma_period"]
-            rsi_buy_threshold = config["indicators"]["rsi_buy_threshold"]
-            rsi_sell_threshold = config["indicators"]["rsi_sell_threshold"]
+            # Get individual signals
+            ma_signal = self._crossover(prev_short_ma, prev_long_ma, last_short_ma, last_long_ma)
+            rsi_signal = self._rsi_level(last_rsi)
             
             # Combined signal logic
-            if ma_signal == 1 and (rsi_signal == 1 or (last_row['rsi'] >= 30 and last_row['rsi'] <= 50)):
+            if ma_signal == 1 and (rsi_signal == 1 or (last_rsi >= 30 and last_rsi <= 50)):
                 # Buy signal: MA crossover (bullish) and RSI is not overbought
-                logger.info(f"Buy signal: MA crossover (bullish) and RSI is {last_row['rsi']:.2f}")
+                logger.info("Buy signal: MA crossover (bullish) and RSI is %.2f", last_rsi)
                 return 1
-            elif ma_signal == -1 and (rsi_signal == -1 or last_row['rsi'] >= 70):
+            elif ma_signal == -1 and (rsi_signal == -1 or last_rsi >= 70):
                 # Sell signal: MA crossover (bearish) and RSI is overbought
-                logger.info(f"Sell signal: MA crossover (bearish) and RSI is {last_row['rsi']:.2f}")
+                logger.info("Sell signal: MA crossover (bearish) and RSI is %.2f", last_rsi)
                 return -1
             else:
                 # No clear signal
                 return 0
         except Exception as e:
-            logger.exception(f"Error getting combined signal: {e}")
+            logger.exception("Error getting combined signal: %s", e)
+            raise
+    
+    def batch_signals(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+        """
+        Get the combined signal of several symbols at once.
+        
+        Equivalent to calling get_combined_signal for each DataFrame, with the
+        signal logic evaluated once over the last two rows of all symbols.
+        
+        Args:
+            frames (Dict[str, pd.DataFrame]): Dictionary of DataFrames with technical indicators.
+        
+        Returns:
+            Dict[str, int]: Dictionary of signals (1 for buy, -1 for sell, 0 for no signal).
+        """
+        try:
+            if not frames:
+                return {}
+            
+            # Last two rows of the signal columns by symbol, shape (symbols, 2, 3)
+            values = np.stack([self._last_rows(df, self.signal_columns) for df in frames.values()])
+            prev_short_ma, prev_long_ma = values[:, 0, 0], values[:, 0, 1]
+            last_short_ma, last_long_ma, last_rsi = values[:, 1, 0], values[:, 1, 1], values[:, 1, 2]
+            
+            # Individual signals
+            bullish = (prev_short_ma <= prev_long_ma) & (last_short_ma > last_long_ma)
+            bearish = (prev_short_ma >= prev_long_ma) & (last_short_ma < last_long_ma)
+            
+            # Combined signal logic (see get_combined_signal)
+            buy = bullish & ((last_rsi < self.rsi_buy_threshold) | ((last_rsi >= 30) & (last_rsi <= 50)))
+            sell = bearish & ((last_rsi > self.rsi_sell_threshold) | (last_rsi >= 70))
+            signals = buy.astype(np.int8) - sell.astype(np.int8)
+            
+            # Log the signals (skipping the loop entirely below INFO)
+            if logger.isEnabledFor(logging.INFO):
+                for symbol, signal, rsi in zip(frames, signals.tolist(), last_rsi.tolist()):
+                    if signal == 1:
+                        logger.info("Buy signal for %s: MA crossover (bullish) and RSI is %.2f", symbol, rsi)
+                    elif signal == -1:
+                        logger.info("Sell signal for %s: MA crossover (bearish) and RSI is %.2f", symbol, rsi)
+            
+            return dict(zip(frames, signals.tolist()))
+        except Exception as e:
+            logger.exception("Error getting batch signals: %s", e)
             raise
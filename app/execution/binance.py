@@ -5,13 +5,23 @@ This module provides a wrapper for the Binance API.
 """
 
 import logging
+import asyncio
 import ccxt
-from typing import Dict, List, Any, Optional
+import ccxt.pro as ccxtpro
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Any, Optional, Set
 import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Pause before reconnecting a failed WebSocket stream, in seconds
+STREAM_RETRY_DELAY = 5
+
+# Keep-alive connections kept open to Binance (requests run concurrently from worker threads)
+HTTP_POOL_SIZE = 20
+
 class BinanceAPI:
     """
     Binance API wrapper.
@@ -27,17 +37,101 @@ class BinanceAPI:
             api_key (str): Binance API key.
             api_secret (str): Binance API secret.
         """
-        self.exchange = ccxt.binance({
+        exchange_config = {
             'apiKey': api_key,
             'secret': api_secret,
             'enableRateLimit': True,
             'options': {
                 'defaultType': 'spot',
             },
-        })
+        }
+        
+        # Reuse TLS connections across REST calls, with room for concurrent requests
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE))
+        self.exchange = ccxt.binance({**exchange_config, 'session': session})
+        self._symbols = None  # Cached set of market symbols
+        
+        # WebSocket exchange, and the tickers and open orders it keeps up to date
+        self.stream_exchange = ccxtpro.binance(exchange_config)
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self._open_orders: Optional[Dict[str, Dict[str, Any]]] = None  # By order ID, None when not streamed
         
         logger.info("Binance API wrapper initialized")
     
+    def get_symbols(self) -> Set[str]:
+        """
+        Get the set of market symbols listed on Binance.
+        
+        The markets are loaded once and cached for the lifetime of the wrapper.
+        
+        Returns:
+            Set[str]: Market symbols (e.g., {'BTC/USDT', 'ETH/USDT'}).
+        """
+        if self._symbols is None:
+            self._symbols = set(self.exchange.load_markets())
+            logger.info("Loaded %s market symbols", len(self._symbols))
+        return self._symbols
+    
+    async def watch_tickers(self, symbols: List[str]) -> None:
+        """
+        Stream tickers from the Binance WebSocket into the ticker cache.
+        
+        Runs until cancelled, reconnecting after errors.
+        
+        Args:
+            symbols (List[str]): Trading pair symbols (e.g., ['BTC/USDT', 'ETH/USDT']).
+        """
+        while True:
+            try:
+                while True:
+                    self._tickers.update(await self.stream_exchange.watch_tickers(symbols))
+            except Exception as e:
+                # Do not serve stale tickers while disconnected
+                self._tickers.clear()
+                logger.exception("Error streaming tickers: %s", e)
+                await asyncio.sleep(STREAM_RETRY_DELAY)
+    
+    async def watch_orders(self, symbols: List[str]) -> None:
+        """
+        Stream order updates from the Binance user data WebSocket into the open orders cache.
+        
+        The cache is seeded with the open orders of each symbol fetched over
+        REST (Binance rejects fetching open orders without a symbol), then
+        orders are added and removed as their updates arrive. Runs until
+        cancelled, reconnecting after errors.
+        
+        Args:
+            symbols (List[str]): Trading pair symbols (e.g., ['BTC/USDT', 'ETH/USDT']).
+        """
+        while True:
+            try:
+                open_orders = {}
+                for symbol in symbols:
+                    orders = await asyncio.to_thread(self.exchange.fetch_open_orders, symbol)
+                    open_orders.update((order["id"], order) for order in orders)
+                self._open_orders = open_orders
+                logger.info("Seeded %s open orders", len(open_orders))
+                
+                while True:
+                    for order in await self.stream_exchange.watch_orders():
+                        if order["status"] == "open":
+                            self._open_orders[order["id"]] = order
+                        else:
+                            self._open_orders.pop(order["id"], None)
+            except Exception as e:
+                self._open_orders = None
+                logger.exception("Error streaming orders: %s", e)
+                await asyncio.sleep(STREAM_RETRY_DELAY)
+    
+    async def close(self) -> None:
+        """
+        Close the WebSocket connections.
+        """
+        self._tickers.clear()
+        self._open_orders = None
+        await self.stream_exchange.close()
+    
     def get_balance(self) -> Dict[str, Any]:
         """
         Get account balance from Binance.
@@ -45,31 +139,49 @@ class BinanceAPI:
         Returns:
             Dict[str, Any]: Account balance.
         """
-        try:
-            balance = self.exchange.fetch_balance()
-            logger.info("Fetched account balance")
-            return balance
-        except Exception as e:
-            logger.exception(f"Error fetching balance: {e}")
-            raise
+        balance = self.exchange.fetch_balance()
+        logger.info("Fetched account balance")
+        return balance
     
     def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """
         Get current ticker data from Binance.
         
+        Streamed tickers are served from the cache, other symbols are fetched.
+        
         Args:
             symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
         
         Returns:
             Dict[str, Any]: Ticker data.
         """
-        try:
-            ticker = self.exchange.fetch_ticker(symbol)
-            logger.info(f"Fetched ticker for {symbol}")
+        ticker = self._tickers.get(symbol)
+        if ticker is not None:
             return ticker
-        except Exception as e:
-            logger.exception(f"Error fetching ticker: {e}")
-            raise
+        
+        ticker = self.exchange.fetch_ticker(symbol)
+        logger.info("Fetched ticker for %s", symbol)
+        return ticker
+    
+    def get_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get current ticker data for several symbols from Binance in a single request.
+        
+        If all the symbols are streamed, the tickers are served from the cache.
+        
+        Args:
+            symbols (List[str]): Trading pair symbols (e.g., ['BTC/USDT', 'ETH/USDT']).
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Ticker data by symbol.
+        """
+        cached = {symbol: self._tickers.get(symbol) for symbol in symbols}
+        if None not in cached.values():
+            return cached
+        
+        tickers = self.exchange.fetch_tickers(symbols)
+        logger.info("Fetched %s tickers", len(tickers))
+        return tickers
     
     def create_market_buy_order(self, symbol: str, amount: float) -> Dict[str, Any]:
         """
@@ -82,13 +194,9 @@ class BinanceAPI:
         Returns:
             Dict[str, Any]: Order data.
         """
-        try:
-            order = self.exchange.create_market_buy_order(symbol, amount)
-            logger.info(f"Created market buy order for {amount} {symbol}")
-            return order
-        except Exception as e:
-            logger.exception(f"Error creating market buy order: {e}")
-            raise
+        order = self.exchange.create_market_buy_order(symbol, amount)
+        logger.info("Created market buy order for %s %s", amount, symbol)
+        return order
     
     def create_market_sell_order(self, symbol: str, amount: float) -> Dict[str, Any]:
         """
@@ -101,13 +209,9 @@ class BinanceAPI:
         Returns:
             Dict[str, Any]: Order data.
         """
-        try:
-            order = self.exchange.create_market_sell_order(symbol, amount)
-            logger.info(f"Created market sell order for {amount} {symbol}")
-            return order
-        except Exception as e:
-            logger.exception(f"Error creating market sell order: {e}")
-            raise
+        order = self.exchange.create_market_sell_order(symbol, amount)
+        logger.info("Created market sell order for %s %s", amount, symbol)
+        return order
     
     def create_limit_buy_order(self, symbol: str, amount: float, price: float) -> Dict[str, Any]:
         """
@@ -121,13 +225,9 @@ class BinanceAPI:
         Returns:
             Dict[str, Any]: Order data.
         """
-        try:
-            order = self.exchange.create_limit_buy_order(symbol, amount, price)
-            logger.info(f"Created limit buy order for {amount} {symbol} at {price}")
-            return order
-        except Exception as e:
-            logger.exception(f"Error creating limit buy order: {e}")
-            raise
+        order = self.exchange.create_limit_buy_order(symbol, amount, price)
+        logger.info("Created limit buy order for %s %s at %s", amount, symbol, price)
+        return order
     
     def create_limit_sell_order(self, symbol: str, amount: float, price: float) -> Dict[str, Any]:
         """
@@ -141,13 +241,9 @@ class BinanceAPI:
         Returns:
             Dict[str, Any]: Order data.
         """
-        try:
-            order = self.exchange.create_limit_sell_order(symbol, amount, price)
-            logger.info(f"Created limit sell order for {amount} {symbol} at {price}")
-            return order
-        except Exception as e:
-            logger.exception(f"Error creating limit sell order: {e}")
-            raise
+        order = self.exchange.create_limit_sell_order(symbol, amount, price)
+        logger.info("Created limit sell order for %s %s at %s", amount, symbol, price)
+        return order
     
     def cancel_order(self, order_id: str, symbol: str) -> Dict[str, Any]:
         """
@@ -160,13 +256,9 @@ class BinanceAPI:
         Returns:
             Dict[str, Any]: Order data.
         """
-        try:
-            order = self.exchange.cancel_order(order_id, symbol)
-            logger.info(f"Cancelled order {order_id} for {symbol}")
-            return order
-        except Exception as e:
-            logger.exception(f"Error cancelling order: {e}")
-            raise
+        order = self.exchange.cancel_order(order_id, symbol)
+        logger.info("Cancelled order %s for %s", order_id, symbol)
+        return order
     
     def get_order(self, order_id: str, symbol: str) -> Dict[str, Any]:
         """
@@ -179,31 +271,30 @@ class BinanceAPI:
         Returns:
             Dict[str, Any]: Order data.
         """
-        try:
-            order = self.exchange.fetch_order(order_id, symbol)
-            logger.info(f"Fetched order {order_id} for {symbol}")
-            return order
-        except Exception as e:
-            logger.exception(f"Error fetching order: {e}")
-            raise
+        order = self.exchange.fetch_order(order_id, symbol)
+        logger.info("Fetched order %s for %s", order_id, symbol)
+        return order
     
     def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get open orders from Binance.
         
+        While the user data stream is live, the open orders are served from the cache.
+        
         Args:
             symbol (str, optional): Trading pair symbol (e.g., 'BTC/USDT'). Defaults to None.
         
         Returns:
             List[Dict[str, Any]]: Open orders.
         """
-        try:
-            orders = self.exchange.fetch_open_orders(symbol)
-            logger.info(f"Fetched {len(orders)} open orders")
-            return orders
-        except Exception as e:
-            logger.exception(f"Error fetching open orders: {e}")
-            raise
+        open_orders = self._open_orders
+        if open_orders is not None:
+            # Copy the values first, the stream may update the cache while this runs in a worker thread
+            return [order for order in list(open_orders.values()) if symbol is None or order["symbol"] == symbol]
+        
+        orders = self.exchange.fetch_open_orders(symbol)
+        logger.info("Fetched %s open orders", len(orders))
+        return orders
     
     def get_closed_orders(self, symbol: str) -> List[Dict[str, Any]]:
         """
@@ -215,13 +306,9 @@ class BinanceAPI:
         Returns:
             List[Dict[str, Any]]: Closed orders.
         """
-        try:
-            orders = self.exchange.fetch_closed_orders(symbol)
-            logger.info(f"Fetched {len(orders)} closed orders for {symbol}")
-            return orders
-        except Exception as e:
-            logger.exception(f"Error fetching closed orders: {e}")
-            raise
+        orders = self.exchange.fetch_closed_orders(symbol)
+        logger.info("Fetched %s closed orders for %s", len(orders), symbol)
+        return orders
     
     def get_my_trades(self, symbol: str) -> List[Dict[str, Any]]:
         """
@@ -233,10 +320,6 @@ class BinanceAPI:
         Returns:
             List[Dict[str, Any]]: Trades.
         """
-        try:
-            trades = self.exchange.fetch_my_trades(symbol)
-            logger.info(f"Fetched {len(trades)} trades for {symbol}")
-            return trades
-        except Exception as e:
-            logger.exception(f"Error fetching trades: {e}")
-            raise
+        trades = self.exchange.fetch_my_trades(symbol)
+        logger.info("Fetched %s trades for %s", len(trades), symbol)
+        return trades
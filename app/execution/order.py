@@ -5,7 +5,9 @@ This module provides a class for managing orders.
 """
 
 import logging
-import uuid
+import itertools
+import time
+import numpy as np
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -13,11 +15,41 @@ from app.execution.binance import BinanceAPI
 
 logger = logging.getLogger(__name__)
 
+# Order status codes (statuses are stored as int8 codes, unknown statuses get new codes)
+_STATUS_NAMES: List[Optional[str]] = ["open", "new", "partially_filled", "closed", "filled", "canceled"]
+_STATUS_CODES: Dict[Optional[str], int] = {status: code for code, status in enumerate(_STATUS_NAMES)}
+STATUS_CANCELED = _STATUS_CODES["canceled"]
+
+# Order status codes counted as open and as closed
+_OPEN_STATUSES = np.array([_STATUS_CODES[status] for status in ("open", "new", "partially_filled")], dtype=np.int8)
+_CLOSED_STATUSES = np.array([_STATUS_CODES[status] for status in ("closed", "filled", "canceled")], dtype=np.int8)
+
+# Initial capacity of the order columns (doubled when full)
+_INITIAL_CAPACITY = 64
+
+def _status_code(status: Optional[str]) -> int:
+    """
+    Get the code of an order status.
+    
+    Args:
+        status (str, optional): Order status (e.g., 'open').
+    
+    Returns:
+        int: Status code.
+    """
+    code = _STATUS_CODES.get(status)
+    if code is None:
+        code = _STATUS_CODES[status] = len(_STATUS_NAMES)
+        _STATUS_NAMES.append(status)
+    return code
+
 class OrderManager:
     """
     Order manager.
     
-    This class is responsible for managing orders.
+    This class is responsible for managing orders. Orders are stored as
+    columns (one list or array per field), with one row per order in creation
+    order.
     """
     
     def __init__(self, binance_api: BinanceAPI, config: Dict[str, Any]):
@@ -30,10 +62,130 @@ class OrderManager:
         """
         self.binance_api = binance_api
         self.config = config
-        self.orders = {}  # Dictionary to store orders
+        
+        # Order columns
+        self.ids: List[str] = []
+        self.exchange_ids: List[str] = []
+        self.symbols: List[str] = []
+        self.types: List[str] = []
+        self.timestamps = np.empty(_INITIAL_CAPACITY, dtype=np.int64)  # Nanoseconds since the epoch
+        self.amounts = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self.prices = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self.statuses = np.empty(_INITIAL_CAPACITY, dtype=np.int8)
+        
+        # Order IDs: the start time (hex seconds) followed by a sequence number
+        self._id_prefix = f"{int(time.time()):x}-"
+        self._order_seq = itertools.count()
+        
+        # Rows by order ID and by Binance order ID
+        self._rows: Dict[str, int] = {}
+        self._exchange_rows: Dict[str, int] = {}
         
         logger.info("Order manager initialized")
     
+    def _add_order(self, order_id: str, order_type: str, symbol: str, amount: float, price: Optional[float], order: Dict[str, Any]) -> int:
+        """
+        Store a new order.
+        
+        Args:
+            order_id (str): Order ID.
+            order_type (str): Order type ('buy' or 'sell').
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            amount (float): Order amount.
+            price (float, optional): Limit price, None for a market order.
+            order (Dict[str, Any]): Order data returned by Binance.
+        
+        Returns:
+            int: Row of the order.
+        """
+        row = len(self.ids)
+        
+        # Grow the array columns
+        if row == len(self.amounts):
+            capacity = 2 * len(self.amounts)
+            for name in ("timestamps", "amounts", "prices", "statuses"):
+                column = getattr(self, name)
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:row] = column
+                setattr(self, name, grown)
+        
+        self.ids.append(order_id)
+        self.exchange_ids.append(order["id"])
+        self.symbols.append(symbol)
+        self.types.append(order_type)
+        self.timestamps[row] = time.time_ns()
+        self.amounts[row] = amount
+        price = price if price is not None else order["price"]
+        self.prices[row] = np.nan if price is None else price
+        self.statuses[row] = _status_code(order["status"])
+        
+        self._rows[order_id] = row
+        self._exchange_rows[order["id"]] = row
+        
+        return row
+    
+    def _order_at(self, row: int) -> Dict[str, Any]:
+        """
+        Get the data of an order.
+        
+        Args:
+            row (int): Row of the order.
+        
+        Returns:
+            Dict[str, Any]: Order data.
+        """
+        return {
+            "id": self.ids[row],
+            "exchange_id": self.exchange_ids[row],
+            "symbol": self.symbols[row],
+            "type": self.types[row],
+            "amount": float(self.amounts[row]),
+            "price": float(self.prices[row]),
+            "status": _STATUS_NAMES[self.statuses[row]],
+            "timestamp": self._format_ts(int(self.timestamps[row])),
+        }
+    
+    @staticmethod
+    def _format_ts(ns: int) -> str:
+        """
+        Format an order timestamp.
+        
+        Args:
+            ns (int): Timestamp in nanoseconds since the epoch.
+        
+        Returns:
+            str: Local time in ISO format.
+        """
+        seconds, ns = divmod(ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=ns // 1000).isoformat()
+    
+    def _rows_from_indices(self, rows: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Get the data of several orders.
+        
+        Args:
+            rows (np.ndarray): Rows of the orders.
+        
+        Returns:
+            List[Dict[str, Any]]: Order data.
+        """
+        return [self._order_at(row) for row in rows.tolist()]
+    
+    def _get_row(self, order_id: str) -> int:
+        """
+        Get the row of an order.
+        
+        Args:
+            order_id (str): Order ID.
+        
+        Returns:
+            int: Row of the order.
+        """
+        row = self._rows.get(order_id)
+        if row is None:
+            raise ValueError(f"Order {order_id} not found")
+        return row
+    
     def create_buy_order(self, symbol: str, amount: float, price: Optional[float] = None) -> Dict[str, Any]:
         """
         Create a buy order.
@@ -48,7 +200,7 @@ class OrderManager:
         """
         try:
             # Generate a unique order ID
-            order_id = str(uuid.uuid4())
+            order_id = self._id_prefix + format(next(self._order_seq), 'x')
             
             # Create the order
             if price is None:
@@ -59,22 +211,13 @@ class OrderManager:
                 order = self.binance_api.create_limit_buy_order(symbol, amount, price)
             
             # Store the order
-            self.orders[order_id] = {
-                "id": order_id,
-                "exchange_id": order["id"],
-                "symbol": symbol,
-                "type": "buy",
-                "amount": amount,
-                "price": price if price is not None else order["price"],
-                "status": order["status"],
-                "timestamp": datetime.now().isoformat(),
-            }
-            
-            logger.info(f"Created buy order {order_id} for {amount} {symbol}")
-            
-            return self.orders[order_id]
+            row = self._add_order(order_id, "buy", symbol, amount, price, order)
+            
+            logger.info("Created buy order %s for %s %s", order_id, amount, symbol)
+            
+            return self._order_at(row)
         except Exception as e:
-            logger.exception(f"Error creating buy order: {e}")
+            logger.exception("Error creating buy order: %s", e)
             raise
     
     def create_sell_order(self, symbol: str, amount: float, price: Optional[float] = None) -> Dict[str, Any]:
@@ -91,7 +234,7 @@ class OrderManager:
         """
         try:
             # Generate a unique order ID
-            order_id = str(uuid.uuid4())
+            order_id = self._id_prefix + format(next(self._order_seq), 'x')
             
             # Create the order
             if price is None:
@@ -102,22 +245,13 @@ class OrderManager:
                 order = self.binance_api.create_limit_sell_order(symbol, amount, price)
             
             # Store the order
-            self.orders[order_id] = {
-                "id": order_id,
-                "exchange_id": order["id"],
-                "symbol": symbol,
-                "type": "sell",
-                "amount": amount,
-                "price": price if price is not None else order["price"],
-                "status": order["status"],
-                "timestamp": datetime.now().isoformat(),
-            }
-            
-            logger.info(f"Created sell order {order_id} for {amount} {symbol}")
-            
-            return self.orders[order_id]
+            row = self._add_order(order_id, "sell", symbol, amount, price, order)
+            
+            logger.info("Created sell order %s for %s %s", order_id, amount, symbol)
+            
+            return self._order_at(row)
         except Exception as e:
-            logger.exception(f"Error creating sell order: {e}")
+            logger.exception("Error creating sell order: %s", e)
             raise
     
     def cancel_order(self, order_id: str) -> Dict[str, Any]:
@@ -132,21 +266,19 @@ class OrderManager:
         """
         try:
             # Get the order
-            order = self.orders.get(order_id)
-            if order is None:
-                raise ValueError(f"Order {order_id} not found")
+            row = self._get_row(order_id)
             
             # Cancel the order
-            self.binance_api.cancel_order(order["exchange_id"], order["symbol"])
+            self.binance_api.cancel_order(self.exchange_ids[row], self.symbols[row])
             
             # Update the order status
-            order["status"] = "canceled"
+            self.statuses[row] = STATUS_CANCELED
             
-            logger.info(f"Cancelled order {order_id}")
+            logger.info("Cancelled order %s", order_id)
             
-            return order
+            return self._order_at(row)
         except Exception as e:
-            logger.exception(f"Error cancelling order: {e}")
+            logger.exception("Error cancelling order: %s", e)
             raise
     
     def get_order(self, order_id: str) -> Dict[str, Any]:
@@ -161,21 +293,19 @@ class OrderManager:
         """
         try:
             # Get the order
-            order = self.orders.get(order_id)
-            if order is None:
-                raise ValueError(f"Order {order_id} not found")
+            row = self._get_row(order_id)
             
             # Get the order from Binance
-            binance_order = self.binance_api.get_order(order["exchange_id"], order["symbol"])
+            binance_order = self.binance_api.get_order(self.exchange_ids[row], self.symbols[row])
             
             # Update the order status
-            order["status"] = binance_order["status"]
+            self.statuses[row] = _status_code(binance_order["status"])
             
-            logger.info(f"Fetched order {order_id}")
+            logger.info("Fetched order %s", order_id)
             
-            return order
+            return self._order_at(row)
         except Exception as e:
-            logger.exception(f"Error fetching order: {e}")
+            logger.exception("Error fetching order: %s", e)
             raise
     
     def get_open_orders(self) -> List[Dict[str, Any]]:
@@ -189,20 +319,23 @@ class OrderManager:
             # Get open orders from Binance
             binance_orders = self.binance_api.get_open_orders()
             
-            # Update the order status
-            open_orders = []
-            for order_id, order in self.orders.items():
-                for binance_order in binance_orders:
-                    if order["exchange_id"] == binance_order["id"]:
-                        order["status"] = binance_order["status"]
-                        if order["status"] in ["open", "new", "partially_filled"]:
-                            open_orders.append(order)
+            # Update the status of our orders listed by Binance
+            matched = []
+            for binance_order in binance_orders:
+                row = self._exchange_rows.get(binance_order["id"])
+                if row is not None:
+                    self.statuses[row] = _status_code(binance_order["status"])
+                    matched.append(row)
+            
+            # Keep the ones that are still open, in creation order
+            rows = np.sort(np.array(matched, dtype=np.int64))
+            open_orders = self._rows_from_indices(rows[np.isin(self.statuses[rows], _OPEN_STATUSES)])
             
-            logger.info(f"Fetched {len(open_orders)} open orders")
+            logger.info("Fetched %s open orders", len(open_orders))
             
             return open_orders
         except Exception as e:
-            logger.exception(f"Error fetching open orders: {e}")
+            logger.exception("Error fetching open orders: %s", e)
             raise
     
     def get_closed_orders(self) -> List[Dict[str, Any]]:
@@ -214,16 +347,14 @@ class OrderManager:
         """
         try:
             # Get closed orders
-            closed_orders = []
-            for order_id, order in self.orders.items():
-                if order["status"] in ["closed", "filled", "canceled"]:
-                    closed_orders.append(order)
+            mask = np.isin(self.statuses[:len(self.ids)], _CLOSED_STATUSES)
+            closed_orders = self._rows_from_indices(np.flatnonzero(mask))
             
-            logger.info(f"Fetched {len(closed_orders)} closed orders")
+            logger.info("Fetched %s closed orders", len(closed_orders))
             
             return closed_orders
         except Exception as e:
-            logger.exception(f"Error fetching closed orders: {e}")
+            logger.exception("Error fetching closed orders: %s", e)
             raise
     
     def get_all_orders(self) -> List[Dict[str, Any]]:
@@ -235,11 +366,11 @@ class OrderManager:
         """
         try:
             # Get all orders
-            all_orders = list(self.orders.values())
+            all_orders = [self._order_at(row) for row in range(len(self.ids))]
             
-            logger.info(f"Fetched {len(all_orders)} orders")
+            logger.info("Fetched %s orders", len(all_orders))
             
             return all_orders
         except Exception as e:
-            logger.exception(f"Error fetching all orders: {e}")
+            logger.exception("Error fetching all orders: %s", e)
             raise
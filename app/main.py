@@ -6,14 +6,16 @@ This module is the entry point for the FastAPI application.
 
 import asyncio
 import logging
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 
-from app.config import get_config, validate_config
+from app.config import get_config
 from app.bot import TradingBot
-from app.api.routes import router as api_router
+from app.api.routes import router as api_router, get_current_config, shutdown_backtest_pool
+from app.state import BotState
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +29,7 @@ app = FastAPI(
     title="Binance Trading Bot",
     description="A trading bot for Binance spot trading",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -38,12 +41,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global variables
-bot_instance = None
-
 # Include API routes
 app.include_router(api_router, prefix="/api")
 
+# Stop the backtest worker processes with the server
+@app.on_event("shutdown")
+async def shutdown():
+    shutdown_backtest_pool()
+
+# Log unhandled errors once, where they leave the application
+@app.exception_handler(Exception)
+async def handle_exception(request: Request, exc: Exception):
+    logger.error("Unhandled error on %s %s: %s", request.method, request.url.path, exc, exc_info=exc)
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+
 # Root route
 @app.get("/", response_model=Dict[str, str])
 async def root():
@@ -52,23 +63,24 @@ async def root():
 # Start bot route
 @app.post("/start", response_model=Dict[str, str])
 async def start_bot(background_tasks: BackgroundTasks):
-    global bot_instance
+    bot_instance = BotState.instance
     
     if bot_instance is not None and bot_instance.is_running:
         return {"message": "Bot is already running"}
     
-    # Validate configuration
-    if not validate_config():
+    # Get the current configuration (including /config updates)
+    valid, config = get_current_config()
+    if not valid:
         raise HTTPException(
             status_code=500,
             detail="Bot is not properly configured. Check the logs for details.",
         )
     
-    # Get configuration
-    config = get_config()
-    
-    # Create bot instance
+    # Create bot instance, marked as running right away so that a /start
+    # arriving before the background task has started does not create another
     bot_instance = TradingBot(config)
+    bot_instance.is_running = True
+    BotState.instance = bot_instance
     
     # Start the bot in a background task
     background_tasks.add_task(bot_instance.run)
@@ -78,7 +90,7 @@ async def start_bot(background_tasks: BackgroundTasks):
 # Stop bot route
 @app.post("/stop", response_model=Dict[str, str])
 async def stop_bot():
-    global bot_instance
+    bot_instance = BotState.instance
     
     if bot_instance is None or not bot_instance.is_running:
         return {"message": "Bot is already stopped"}
@@ -92,6 +104,9 @@ async def stop_bot():
 def run_app():
     """
     Run the FastAPI application.
+    
+    Serves with uvloop and httptools when they are installed. A single worker
+    is used, since the bot instance lives in the server process.
     """
     import uvicorn
     
@@ -100,7 +115,9 @@ def run_app():
         "app.main:app",
         host=config["api"]["host"],
         port=config["api"]["port"],
-        reload=True,
+        reload=config["api"]["reload"],
+        loop="auto",
+        http="auto",
     )
 
 # Run the bot directly (without API)
@@ -108,14 +125,12 @@ async def run_bot():
     """
     Run the trading bot directly (without API).
     """
-    # Validate configuration
-    if not validate_config():
+    # Get the current configuration (including /config updates)
+    valid, config = get_current_config()
+    if not valid:
         logger.error("Bot is not properly configured. Check the logs for details.")
         return
     
-    # Get configuration
-    config = get_config()
-    
     # Create bot instance
     bot = TradingBot(config)
     
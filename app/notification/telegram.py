@@ -6,50 +6,219 @@ This module provides a class for sending Telegram notifications.
 
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
+from aiolimiter import AsyncLimiter
 from telegram import Bot
-from telegram.error import TelegramError
+from telegram.error import RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
+
+from app.risk.manager import Position
 
 logger = logging.getLogger(__name__)
 
+MAX_MESSAGE_LENGTH = 4096  # Telegram's limit for the text of a message
+BATCH_FLUSH_INTERVAL = 3.0  # Seconds to collect messages before sending them
+HTTP_POOL_SIZE = 32  # Keep-alive connections to the Telegram Bot API
+RATE_LIMIT = 30  # Messages per second allowed by Telegram for a bot
+
+# Message templates, by trade/signal type where the text depends on it
+TRADE_TEMPLATES = {
+    "buy": "🤖 *TRADE ALERT*\n\n✅ *BUY* {amount} {symbol} at ${price:.2f}\n💰 Total: ${total:.2f}",
+    "sell": "🤖 *TRADE ALERT*\n\n🔴 *SELL* {amount} {symbol} at ${price:.2f}\n💰 Total: ${total:.2f}",
+}
+TRADE_TEMPLATE = "🤖 *TRADE ALERT*\n\n💰 Total: ${total:.2f}"
+SIGNAL_TEMPLATES = {
+    "buy": "🤖 *SIGNAL ALERT*\n\n🟢 *BUY SIGNAL* for {symbol} at ${price:.2f}\n\n*Indicators:*\n",
+    "sell": "🤖 *SIGNAL ALERT*\n\n🔴 *SELL SIGNAL* for {symbol} at ${price:.2f}\n\n*Indicators:*\n",
+}
+SIGNAL_TEMPLATE = "🤖 *SIGNAL ALERT*\n\n*Indicators:*\n"
+INDICATOR_TEMPLATE = "- {}: {:.2f}\n"
+ERROR_TEMPLATE = "🤖 *ERROR ALERT*\n\n❌ {}"
+STATUS_TEMPLATE = "🤖 *STATUS UPDATE*\n\nℹ️ {}"
+PORTFOLIO_TEMPLATE = (
+    "🤖 *PORTFOLIO UPDATE*\n\n"
+    "💰 *Total Value:* ${total_value:.2f}\n"
+    "📈 *Profit/Loss:* ${profit_loss:.2f} ({profit_loss_percentage:.2f}%)\n\n"
+    "*Positions:*\n"
+)
+POSITION_TEMPLATE = (
+    "- {0.symbol}: {0.amount} @ ${0.entry_price:.2f} (Current: ${0.current_price:.2f})\n"
+    "  P/L: ${0.profit_loss:.2f} ({0.profit_loss_percentage:.2f}%)\n"
+)
+
 class TelegramNotifier:
     """
     Telegram notifier.
     
     This class is responsible for sending Telegram notifications.
+    
+    Messages are queued and sent by a background worker, which collects the
+    messages queued within `flush_interval` seconds and sends them joined
+    into as few Telegram messages as `max_buffer_size` allows.
     """
     
-    def __init__(self, token: str, chat_id: str):
+    def __init__(
+        self,
+        token: str,
+        chat_id: str,
+        flush_interval: float = BATCH_FLUSH_INTERVAL,
+        max_buffer_size: int = MAX_MESSAGE_LENGTH,
+        pool_size: int = HTTP_POOL_SIZE,
+    ):
         """
         Initialize the Telegram notifier.
         
         Args:
             token (str): Telegram bot token.
             chat_id (str): Telegram chat ID.
+            flush_interval (float, optional): Seconds to collect messages before sending them. Defaults to BATCH_FLUSH_INTERVAL.
+            max_buffer_size (int, optional): Maximum length of a sent message. Defaults to MAX_MESSAGE_LENGTH.
+            pool_size (int, optional): Number of pooled connections to Telegram. Defaults to HTTP_POOL_SIZE.
         """
         self.token = token
         self.chat_id = chat_id
-        self.bot = Bot(token=token)
+        
+        # Reuse pooled keep-alive connections for all requests
+        request = HTTPXRequest(
+            connection_pool_size=pool_size,
+            pool_timeout=10.0,
+            connect_timeout=5.0,
+            read_timeout=15.0,
+        )
+        self.bot = Bot(token=token, request=request)
+        self.flush_interval = flush_interval
+        self.max_buffer_size = min(max_buffer_size, MAX_MESSAGE_LENGTH)
+        
+        # Queued messages (None asks the worker to stop) and the worker sending them
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        
+        # Stay under Telegram's rate limit to avoid flood control
+        self._limiter = AsyncLimiter(max_rate=RATE_LIMIT, time_period=1.0)
         
         logger.info("Telegram notifier initialized")
     
-    async def send_message(self, message: str) -> None:
+    def send_message(self, message: str) -> None:
         """
-        Send a message to Telegram.
+        Queue a message to be sent to Telegram.
+        
+        The message is sent by the background worker, so this returns without
+        waiting for Telegram. Sending errors are logged by the worker.
         
         Args:
             message (str): Message to send.
         """
-        try:
-            await self.bot.send_message(chat_id=self.chat_id, text=message)
-            logger.info(f"Sent Telegram message: {message}")
-        except TelegramError as e:
-            logger.exception(f"Error sending Telegram message: {e}")
-            raise
+        # Start the worker on the running event loop
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._flush_loop())
+        
+        self._queue.put_nowait(message)
     
-    async def send_trade_notification(self, trade_type: str, symbol: str, amount: float, price: float) -> None:
+    def send_many(self, messages: Iterable[str]) -> None:
         """
-        Send a trade notification to Telegram.
+        Queue several messages to be sent to Telegram, in order.
+        
+        Messages queued together are batched by the worker into as few
+        Telegram messages as the length limit allows.
+        
+        Args:
+            messages (Iterable[str]): Messages to send.
+        """
+        for message in messages:
+            self.send_message(message)
+    
+    async def aclose(self) -> None:
+        """
+        Send the queued messages and stop the worker.
+        """
+        if self._worker is None:
+            return
+        
+        self._queue.put_nowait(None)
+        await self._worker
+        self._worker = None
+    
+    async def _flush_loop(self) -> None:
+        """
+        Collect the queued messages and send them in batches until stopped.
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+        
+        while not stopping:
+            # Wait for a message, then collect more until the interval expires or the buffer is full
+            message = await self._queue.get()
+            if message is None:
+                break
+            
+            messages = [message]
+            size = len(message)
+            deadline = loop.time() + self.flush_interval
+            while size < self.max_buffer_size:
+                try:
+                    message = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                
+                if message is None:
+                    stopping = True
+                    break
+                
+                messages.append(message)
+                size += len(message) + 2
+            
+            await self._flush(messages)
+    
+    async def _flush(self, messages: List[str]) -> None:
+        """
+        Send messages joined with blank lines, in chunks of at most max_buffer_size characters.
+        
+        Args:
+            messages (List[str]): Messages to send.
+        """
+        chunks = []
+        chunk = ""
+        for message in messages:
+            if chunk and len(chunk) + 2 + len(message) <= self.max_buffer_size:
+                chunk += "\n\n" + message
+                continue
+            
+            if chunk:
+                chunks.append(chunk)
+            
+            # Split messages longer than a chunk
+            while len(message) > self.max_buffer_size:
+                chunks.append(message[:self.max_buffer_size])
+                message = message[self.max_buffer_size:]
+            chunk = message
+        chunks.append(chunk)
+        
+        for chunk in chunks:
+            await self._send(chunk)
+    
+    async def _send(self, text: str) -> None:
+        """
+        Send a message to Telegram, waiting out flood control if it is hit.
+        
+        Args:
+            text (str): Message to send.
+        """
+        while True:
+            try:
+                async with self._limiter:
+                    await self.bot.send_message(chat_id=self.chat_id, text=text)
+                logger.info("Sent Telegram message: %s", text)
+                return
+            except RetryAfter as e:
+                logger.warning("Telegram flood control exceeded, retrying in %s seconds", e.retry_after)
+                await asyncio.sleep(e.retry_after)
+            except TelegramError as e:
+                logger.exception("Error sending Telegram message: %s", e)
+                return
+    
+    def send_trade_notification(self, trade_type: str, symbol: str, amount: float, price: float) -> None:
+        """
+        Queue a trade notification to Telegram.
         
         Args:
             trade_type (str): Trade type ('buy' or 'sell').
@@ -58,23 +227,16 @@ class TelegramNotifier:
             price (float): Price of the asset.
         """
         try:
-            message = f"🤖 *TRADE ALERT*\n\n"
-            
-            if trade_type.lower() == "buy":
-                message += f"✅ *BUY* {amount} {symbol} at ${price:.2f}\n"
-            elif trade_type.lower() == "sell":
-                message += f"🔴 *SELL* {amount} {symbol} at ${price:.2f}\n"
-            
-            message += f"💰 Total: ${amount * price:.2f}"
+            template = TRADE_TEMPLATES.get(trade_type.lower(), TRADE_TEMPLATE)
+            message = template.format(amount=amount, symbol=symbol, price=price, total=amount * price)
             
-            await self.send_message(message)
+            self.send_message(message)
         except Exception as e:
-            logger.exception(f"Error sending trade notification: {e}")
-            raise
+            logger.exception("Error sending trade notification: %s", e)
     
-    async def send_signal_notification(self, signal_type: str, symbol: str, price: float, indicators: Dict[str, float]) -> None:
+    def send_signal_notification(self, signal_type: str, symbol: str, price: float, indicators: Dict[str, float]) -> None:
         """
-        Send a signal notification to Telegram.
+        Queue a signal notification to Telegram.
         
         Args:
             signal_type (str): Signal type ('buy' or 'sell').
@@ -83,85 +245,65 @@ class TelegramNotifier:
             indicators (Dict[str, float]): Dictionary of indicators.
         """
         try:
-            message = f"🤖 *SIGNAL ALERT*\n\n"
+            template = SIGNAL_TEMPLATES.get(signal_type.lower(), SIGNAL_TEMPLATE)
+            message = template.format(symbol=symbol, price=price)
+            message += "".join([INDICATOR_TEMPLATE.format(indicator, value) for indicator, value in indicators.items()])
             
-            if signal_type.lower() == "buy":
-                message += f"🟢 *BUY SIGNAL* for {symbol} at ${price:.2f}\n\n"
-            elif signal_type.lower() == "sell":
-                message += f"🔴 *SELL SIGNAL* for {symbol} at ${price:.2f}\n\n"
-            
-            message += "*Indicators:*\n"
-            for indicator, value in indicators.items():
-                message += f"- {indicator}: {value:.2f}\n"
-            
-            await self.send_message(message)
+            self.send_message(message)
         except Exception as e:
-            logger.exception(f"Error sending signal notification: {e}")
-            raise
+            logger.exception("Error sending signal notification: %s", e)
     
-    async def send_error_notification(self, error_message: str) -> None:
+    def send_error_notification(self, error_message: str) -> None:
         """
-        Send an error notification to Telegram.
+        Queue an error notification to Telegram.
         
         Args:
             error_message (str): Error message.
         """
         try:
-            message = f"🤖 *ERROR ALERT*\n\n"
-            message += f"❌ {error_message}"
-            
-            await self.send_message(message)
+            self.send_message(ERROR_TEMPLATE.format(error_message))
         except Exception as e:
-            logger.exception(f"Error sending error notification: {e}")
-            raise
+            logger.exception("Error sending error notification: %s", e)
     
-    async def send_portfolio_notification(self, positions: List[Dict[str, Any]], total_value: float, profit_loss: float) -> None:
+    def send_portfolio_notification(self, positions: List[Position], total_value: float, profit_loss: float) -> None:
         """
-        Send a portfolio notification to Telegram.
+        Queue a portfolio notification to Telegram.
         
         Args:
-            positions (List[Dict[str, Any]]): List of positions.
+            positions (List[Position]): List of positions.
             total_value (float): Total portfolio value.
             profit_loss (float): Total profit/loss.
         """
         try:
-            message = f"🤖 *PORTFOLIO UPDATE*\n\n"
+            messages = [PORTFOLIO_TEMPLATE.format(
+                total_value=total_value,
+                profit_loss=profit_loss,
+                profit_loss_percentage=profit_loss / total_value * 100,
+            )]
             
-            message += f"💰 *Total Value:* ${total_value:.2f}\n"
-            message += f"📈 *Profit/Loss:* ${profit_loss:.2f} ({profit_loss / total_value * 100:.2f}%)\n\n"
-            
-            message += "*Positions:*\n"
+            # Split long portfolios between positions rather than inside one
             for position in positions:
-                symbol = position["symbol"]
-                amount = position["amount"]
-                entry_price = position["entry_price"]
-                current_price = position["current_price"]
-                profit_loss = position["profit_loss"]
-                profit_loss_percentage = position["profit_loss_percentage"]
-                
-                message += f"- {symbol}: {amount} @ ${entry_price:.2f} (Current: ${current_price:.2f})\n"
-                message += f"  P/L: ${profit_loss:.2f} ({profit_loss_percentage:.2f}%)\n"
+                line = POSITION_TEMPLATE.format(position)
+                if len(messages[-1]) + len(line) > self.max_buffer_size:
+                    messages.append(line)
+                else:
+                    messages[-1] += line
             
-            await self.send_message(message)
+            self.send_many(messages)
         except Exception as e:
-            logger.exception(f"Error sending portfolio notification: {e}")
-            raise
+            logger.exception("Error sending portfolio notification: %s", e)
     
-    async def send_status_notification(self, status: str) -> None:
+    def send_status_notification(self, status: str) -> None:
         """
-        Send a status notification to Telegram.
+        Queue a status notification to Telegram.
         
         Args:
             status (str): Status message.
         """
         try:
-            message = f"🤖 *STATUS UPDATE*\n\n"
-            message += f"ℹ️ {status}"
-            
-            await self.send_message(message)
+            self.send_message(STATUS_TEMPLATE.format(status))
         except Exception as e:
-            logger.exception(f"Error sending status notification: {e}")
-            raise
+            logger.exception("Error sending status notification: %s", e)
 
 def create_telegram_notifier(config: Dict[str, Any]) -> Optional[TelegramNotifier]:
     """
@@ -181,7 +323,13 @@ def create_telegram_notifier(config: Dict[str, Any]) -> Optional[TelegramNotifie
             logger.warning("Telegram configuration is not set. Notifications will not be sent.")
             return None
         
-        return TelegramNotifier(token, chat_id)
+        return TelegramNotifier(
+            token,
+            chat_id,
+            flush_interval=config["telegram"]["batch_flush_interval"],
+            max_buffer_size=config["telegram"]["max_buffer_size"],
+            pool_size=config["telegram"]["pool_size"],
+        )
     except Exception as e:
-        logger.exception(f"Error creating Telegram notifier: {e}")
+        logger.exception("Error creating Telegram notifier: %s", e)
         return None
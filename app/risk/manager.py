@@ -5,11 +5,66 @@ This module provides a class for managing risk.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
-import pandas as pd
+from typing import Dict, List, Any, Optional, Tuple, Union
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+class Position:
+    """
+    Open position.
+    
+    This class holds the state of an open position with a fixed set of fields.
+    The inverse of the entry price is computed once, so that updating the
+    profit/loss percentage needs no division.
+    """
+    
+    __slots__ = (
+        "symbol",
+        "amount",
+        "entry_price",
+        "inv_entry_price",
+        "stop_loss",
+        "take_profit",
+        "current_price",
+        "profit_loss",
+        "profit_loss_percentage",
+    )
+    
+    def __init__(
+        self,
+        symbol: str,
+        amount: float,
+        entry_price: float,
+        stop_loss: float,
+        take_profit: float,
+        current_price: float,
+        profit_loss: float = 0.0,
+        profit_loss_percentage: float = 0.0,
+    ):
+        """
+        Initialize the position.
+        
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            amount (float): Amount of the asset.
+            entry_price (float): Entry price.
+            stop_loss (float): Stop loss price.
+            take_profit (float): Take profit price.
+            current_price (float): Current price.
+            profit_loss (float, optional): Profit/loss. Defaults to 0.0.
+            profit_loss_percentage (float, optional): Profit/loss percentage. Defaults to 0.0.
+        """
+        self.symbol = symbol
+        self.amount = amount
+        self.entry_price = entry_price
+        self.inv_entry_price = 1.0 / entry_price
+        self.stop_loss = stop_loss
+        self.take_profit = take_profit
+        self.current_price = current_price
+        self.profit_loss = profit_loss
+        self.profit_loss_percentage = profit_loss_percentage
+
 class RiskManager:
     """
     Risk manager.
@@ -21,11 +76,32 @@ class RiskManager:
         """
         Initialize the risk manager.
         
+        Args:
+            config (Dict[str, Any]): Configuration dictionary.
+        """
+        self.positions: Dict[str, Position] = {}  # Positions by symbol
+        
+        # Position fields used by the portfolio calculations, one row per position
+        self._symbols: List[str] = []
+        self._rows: Dict[str, int] = {}  # Row by symbol
+        self._amounts = np.empty(0, dtype=np.float64)
+        self._entry_prices = np.empty(0, dtype=np.float64)
+        self._inv_entry_prices = np.empty(0, dtype=np.float64)
+        
+        self.update_config(config)
+        
+        logger.info("Risk manager initialized")
+    
+    def update_config(self, config: Dict[str, Any]) -> None:
+        """
+        Apply a configuration to the risk parameters.
+        
+        Open positions keep the stop loss and take profit they were opened with.
+        
         Args:
             config (Dict[str, Any]): Configuration dictionary.
         """
         self.config = config
-        self.positions = {}  # Dictionary to store positions
         
         # Get risk parameters from config
         self.investment_amount = config["trading"]["investment_amount"]
@@ -34,7 +110,15 @@ class RiskManager:
         self.stop_loss_percentage = config["trading"]["stop_loss_percentage"]
         self.take_profit_percentage = config["trading"]["take_profit_percentage"]
         
-        logger.info("Risk manager initialized")
+        # Price factors of the stop loss and take profit
+        self._stop_loss_factor = 1 - self.stop_loss_percentage / 100
+        self._take_profit_factor = 1 + self.take_profit_percentage / 100
+        
+        # Position size per pair, based on risk percentage and limited to max_position_size
+        self._position_size = min(
+            (self.investment_amount * self.risk_percentage / 100) / max(len(config["trading"]["pairs"]), 1),
+            self.max_position_size,
+        )
     
     def calculate_position_size(self, symbol: str, price: float) -> float:
         """
@@ -47,22 +131,12 @@ class RiskManager:
         Returns:
             float: Position size.
         """
-        try:
-            # Calculate position size based on risk percentage
-            position_size = (self.investment_amount * self.risk_percentage / 100) / len(self.config["trading"]["pairs"])
-            
-            # Limit position size to max_position_size
-            position_size = min(position_size, self.max_position_size)
-            
-            # Convert to asset amount
-            asset_amount = position_size / price
-            
-            logger.info(f"Calculated position size for {symbol}: {asset_amount} (${position_size:.2f})")
-            
-            return asset_amount
-        except Exception as e:
-            logger.exception(f"Error calculating position size: {e}")
-            raise
+        # Convert to asset amount
+        asset_amount = self._position_size / price
+        
+        logger.debug("Calculated position size for %s: %s ($%.2f)", symbol, asset_amount, self._position_size)
+        
+        return asset_amount
     
     def calculate_stop_loss(self, symbol: str, entry_price: float) -> float:
         """
@@ -75,15 +149,11 @@ class RiskManager:
         Returns:
             float: Stop loss price.
         """
-        try:
-            stop_loss_price = entry_price * (1 - self.stop_loss_percentage / 100)
-            
-            logger.info(f"Calculated stop loss for {symbol}: {stop_loss_price:.2f}")
-            
-            return stop_loss_price
-        except Exception as e:
-            logger.exception(f"Error calculating stop loss: {e}")
-            raise
+        stop_loss_price = entry_price * self._stop_loss_factor
+        
+        logger.debug("Calculated stop loss for %s: %.2f", symbol, stop_loss_price)
+        
+        return stop_loss_price
     
     def calculate_take_profit(self, symbol: str, entry_price: float) -> float:
         """
@@ -96,17 +166,13 @@ class RiskManager:
         Returns:
             float: Take profit price.
         """
-        try:
-            take_profit_price = entry_price * (1 + self.take_profit_percentage / 100)
-            
-            logger.info(f"Calculated take profit for {symbol}: {take_profit_price:.2f}")
-            
-            return take_profit_price
-        except Exception as e:
-            logger.exception(f"Error calculating take profit: {e}")
-            raise
+        take_profit_price = entry_price * self._take_profit_factor
+        
+        logger.debug("Calculated take profit for %s: %.2f", symbol, take_profit_price)
+        
+        return take_profit_price
     
-    def add_position(self, symbol: str, amount: float, entry_price: float) -> Dict[str, Any]:
+    def add_position(self, symbol: str, amount: float, entry_price: float) -> Position:
         """
         Add a position.
         
@@ -116,7 +182,7 @@ class RiskManager:
             entry_price (float): Entry price.
         
         Returns:
-            Dict[str, Any]: Position data.
+            Position: Position data.
         """
         try:
             # Calculate stop loss and take profit
@@ -124,28 +190,37 @@ class RiskManager:
             take_profit = self.calculate_take_profit(symbol, entry_price)
             
             # Create the position
-            position = {
-                "symbol": symbol,
-                "amount": amount,
-                "entry_price": entry_price,
-                "stop_loss": stop_loss,
-                "take_profit": take_profit,
-                "current_price": entry_price,
-                "profit_loss": 0.0,
-                "profit_loss_percentage": 0.0,
-            }
+            position = Position(
+                symbol=symbol,
+                amount=amount,
+                entry_price=entry_price,
+                stop_loss=stop_loss,
+                take_profit=take_profit,
+                current_price=entry_price,
+            )
             
             # Store the position
             self.positions[symbol] = position
+            row = self._rows.get(symbol)
+            if row is None:
+                self._rows[symbol] = len(self._symbols)
+                self._symbols.append(symbol)
+                self._amounts = np.append(self._amounts, amount)
+                self._entry_prices = np.append(self._entry_prices, entry_price)
+                self._inv_entry_prices = np.append(self._inv_entry_prices, position.inv_entry_price)
+            else:
+                self._amounts[row] = amount
+                self._entry_prices[row] = entry_price
+                self._inv_entry_prices[row] = position.inv_entry_price
             
-            logger.info(f"Added position for {symbol}: {amount} at {entry_price:.2f}")
+            logger.info("Added position for %s: %s at %.2f", symbol, amount, entry_price)
             
             return position
         except Exception as e:
-            logger.exception(f"Error adding position: {e}")
+            logger.exception("Error adding position: %s", e)
             raise
     
-    def update_position(self, symbol: str, current_price: float) -> Dict[str, Any]:
+    def update_position(self, symbol: str, current_price: float) -> Position:
         """
         Update a position.
         
@@ -154,7 +229,7 @@ class RiskManager:
             current_price (float): Current price.
         
         Returns:
-            Dict[str, Any]: Position data.
+            Position: Position data.
         """
         try:
             # Get the position
@@ -163,19 +238,22 @@ class RiskManager:
                 raise ValueError(f"Position for {symbol} not found")
             
             # Update the position
-            position["current_price"] = current_price
-            position["profit_loss"] = (current_price - position["entry_price"]) * position["amount"]
-            position["profit_loss_percentage"] = (current_price / position["entry_price"] - 1) * 100
+            position.current_price = current_price
+            position.profit_loss, position.profit_loss_percentage = self._profit_loss(
+                position.entry_price, position.inv_entry_price, position.amount, current_price
+            )
             
-            logger.info(f"Updated position for {symbol}: {position['amount']} at {current_price:.2f} "
-                       f"(P/L: ${position['profit_loss']:.2f}, {position['profit_loss_percentage']:.2f}%)")
+            logger.debug(
+                "Updated position for %s: %s at %.2f (P/L: $%.2f, %.2f%%)",
+                symbol, position.amount, current_price, position.profit_loss, position.profit_loss_percentage,
+            )
             
             return position
         except Exception as e:
-            logger.exception(f"Error updating position: {e}")
+            logger.exception("Error updating position: %s", e)
             raise
     
-    def remove_position(self, symbol: str) -> Dict[str, Any]:
+    def remove_position(self, symbol: str) -> Position:
         """
         Remove a position.
         
@@ -183,7 +261,7 @@ class RiskManager:
             symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
         
         Returns:
-            Dict[str, Any]: Position data.
+            Position: Position data.
         """
         try:
             # Get the position
@@ -193,15 +271,22 @@ class RiskManager:
             
             # Remove the position
             del self.positions[symbol]
+            row = self._rows.pop(symbol)
+            del self._symbols[row]
+            for moved in self._symbols[row:]:
+                self._rows[moved] -= 1
+            self._amounts = np.delete(self._amounts, row)
+            self._entry_prices = np.delete(self._entry_prices, row)
+            self._inv_entry_prices = np.delete(self._inv_entry_prices, row)
             
-            logger.info(f"Removed position for {symbol}")
+            logger.info("Removed position for %s", symbol)
             
             return position
         except Exception as e:
-            logger.exception(f"Error removing position: {e}")
+            logger.exception("Error removing position: %s", e)
             raise
     
-    def get_position(self, symbol: str) -> Optional[Dict[str, Any]]:
+    def get_position(self, symbol: str) -> Optional[Position]:
         """
         Get a position.
         
@@ -209,16 +294,16 @@ class RiskManager:
             symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
         
         Returns:
-            Optional[Dict[str, Any]]: Position data.
+            Optional[Position]: Position data.
         """
         return self.positions.get(symbol)
     
-    def get_all_positions(self) -> List[Dict[str, Any]]:
+    def get_all_positions(self) -> List[Position]:
         """
         Get all positions.
         
         Returns:
-            List[Dict[str, Any]]: All positions.
+            List[Position]: All positions.
         """
         return list(self.positions.values())
     
@@ -240,13 +325,13 @@ class RiskManager:
                 return False
             
             # Check if the stop loss has been triggered
-            if current_price <= position["stop_loss"]:
-                logger.info(f"Stop loss triggered for {symbol} at {current_price:.2f}")
+            if current_price <= position.stop_loss:
+                logger.info("Stop loss triggered for %s at %.2f", symbol, current_price)
                 return True
             
             return False
         except Exception as e:
-            logger.exception(f"Error checking stop loss: {e}")
+            logger.exception("Error checking stop loss: %s", e)
             raise
     
     def check_take_profit(self, symbol: str, current_price: float) -> bool:
@@ -267,15 +352,41 @@ class RiskManager:
                 return False
             
             # Check if the take profit has been triggered
-            if current_price >= position["take_profit"]:
-                logger.info(f"Take profit triggered for {symbol} at {current_price:.2f}")
+            if current_price >= position.take_profit:
+                logger.info("Take profit triggered for %s at %.2f", symbol, current_price)
                 return True
             
             return False
         except Exception as e:
-            logger.exception(f"Error checking take profit: {e}")
+            logger.exception("Error checking take profit: %s", e)
             raise
     
+    def check_exits(self, prices: Dict[str, float]) -> Dict[str, str]:
+        """
+        Check the stop loss and take profit of several positions in a single pass.
+        
+        Args:
+            prices (Dict[str, float]): Dictionary of current prices.
+        
+        Returns:
+            Dict[str, str]: Triggered exits by symbol ('stop_loss' or 'take_profit').
+        """
+        triggered = {}
+        
+        for symbol, current_price in prices.items():
+            position = self.positions.get(symbol)
+            if position is None:
+                continue
+            
+            if current_price <= position.stop_loss:
+                logger.info("Stop loss triggered for %s at %.2f", symbol, current_price)
+                triggered[symbol] = "stop_loss"
+            elif current_price >= position.take_profit:
+                logger.info("Take profit triggered for %s at %.2f", symbol, current_price)
+                triggered[symbol] = "take_profit"
+        
+        return triggered
+    
     def calculate_portfolio_value(self, prices: Dict[str, float]) -> float:
         """
         Calculate the portfolio value.
@@ -287,23 +398,24 @@ class RiskManager:
             float: Portfolio value.
         """
         try:
-            portfolio_value = 0.0
+            prices_arr = self._aligned_prices(prices)
+            held = ~np.isnan(prices_arr)
             
-            for symbol, position in self.positions.items():
-                if symbol in prices:
-                    portfolio_value += position["amount"] * prices[symbol]
+            portfolio_value = float(np.dot(self._amounts[held], prices_arr[held]))
             
-            logger.info(f"Calculated portfolio value: ${portfolio_value:.2f}")
+            logger.debug("Calculated portfolio value: $%.2f", portfolio_value)
             
             return portfolio_value
         except Exception as e:
-            logger.exception(f"Error calculating portfolio value: {e}")
+            logger.exception("Error calculating portfolio value: %s", e)
             raise
     
     def calculate_portfolio_profit_loss(self, prices: Dict[str, float]) -> Dict[str, float]:
         """
         Calculate the portfolio profit/loss.
         
+        The positions themselves are not updated (see update_position).
+        
         Args:
             prices (Dict[str, float]): Dictionary of current prices.
         
@@ -311,27 +423,65 @@ class RiskManager:
             Dict[str, float]: Portfolio profit/loss.
         """
         try:
-            total_profit_loss = 0.0
             total_profit_loss_percentage = 0.0
             
-            for symbol, position in self.positions.items():
-                if symbol in prices:
-                    # Update the position
-                    self.update_position(symbol, prices[symbol])
-                    
-                    # Add to total profit/loss
-                    total_profit_loss += position["profit_loss"]
+            # Calculate the profit/loss of the positions with a price
+            prices_arr = self._aligned_prices(prices)
+            held = np.flatnonzero(~np.isnan(prices_arr))
+            profit_loss, _ = self._profit_loss(
+                self._entry_prices[held], self._inv_entry_prices[held], self._amounts[held], prices_arr[held]
+            )
+            
+            # Add to total profit/loss
+            total_profit_loss = float(profit_loss.sum())
             
             # Calculate total profit/loss percentage
             if self.investment_amount > 0:
                 total_profit_loss_percentage = (total_profit_loss / self.investment_amount) * 100
             
-            logger.info(f"Calculated portfolio profit/loss: ${total_profit_loss:.2f} ({total_profit_loss_percentage:.2f}%)")
+            logger.info("Calculated portfolio profit/loss: $%.2f (%.2f%%)", total_profit_loss, total_profit_loss_percentage)
             
             return {
                 "profit_loss": total_profit_loss,
                 "profit_loss_percentage": total_profit_loss_percentage,
             }
         except Exception as e:
-            logger.exception(f"Error calculating portfolio profit/loss: {e}")
+            logger.exception("Error calculating portfolio profit/loss: %s", e)
             raise
+    
+    @staticmethod
+    def _profit_loss(
+        entry_price: Union[float, np.ndarray],
+        inv_entry_price: Union[float, np.ndarray],
+        amount: Union[float, np.ndarray],
+        current_price: Union[float, np.ndarray],
+    ) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+        """
+        Calculate the profit/loss of positions (scalars or arrays).
+        
+        Args:
+            entry_price (Union[float, np.ndarray]): Entry price.
+            inv_entry_price (Union[float, np.ndarray]): Inverse of the entry price.
+            amount (Union[float, np.ndarray]): Amount of the asset.
+            current_price (Union[float, np.ndarray]): Current price.
+        
+        Returns:
+            Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]: Profit/loss and profit/loss percentage.
+        """
+        return (current_price - entry_price) * amount, (current_price * inv_entry_price - 1.0) * 100.0
+    
+    def _aligned_prices(self, prices: Dict[str, float]) -> np.ndarray:
+        """
+        Get the prices of the positions in row order.
+        
+        Args:
+            prices (Dict[str, float]): Dictionary of current prices.
+        
+        Returns:
+            np.ndarray: Price of each position, NaN for positions without a price.
+        """
+        return np.fromiter(
+            (prices.get(symbol, np.nan) for symbol in self._symbols),
+            dtype=np.float64,
+            count=len(self._symbols),
+        )
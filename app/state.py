@@ -0,0 +1,19 @@
+"""
+State module for the trading bot.
+
+This module holds the state shared between the FastAPI application and the API routes.
+"""
+
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.bot import TradingBot
+
+class BotState:
+    """
+    Shared bot state.
+    
+    This class holds the bot instance started by the API.
+    """
+    
+    instance: Optional["TradingBot"] = None
@@ -5,9 +5,11 @@ This module provides a base class for all trading strategies.
 """
 
 import logging
-import pandas as pd
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +29,21 @@ class BaseStrategy(ABC):
         """
         self.config = config
         self.name = "BaseStrategy"
-        logger.info(f"Initialized {self.name} strategy")
+        
+        # Price factors of the stop loss and take profit
+        self._stop_loss_factor = 1 - config["trading"]["stop_loss_percentage"] / 100
+        self._take_profit_factor = 1 + config["trading"]["take_profit_percentage"] / 100
+        
+        # Position size per pair, based on risk percentage and limited to max_position_size
+        trading = config["trading"]
+        self._position_size = min(
+            (trading["investment_amount"] * trading["risk_percentage"] / 100) / max(len(trading["pairs"]), 1),
+            trading["max_position_size"],
+        )
+        logger.info("Initialized %s strategy", self.name)
     
     @abstractmethod
-    def generate_signals(self, data: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+    def generate_signals(self, data: Dict[str, "pd.DataFrame"]) -> Dict[str, int]:
         """
         Generate trading signals for all symbols.
         
@@ -43,7 +56,7 @@ class BaseStrategy(ABC):
         pass
     
     @abstractmethod
-    def should_buy(self, symbol: str, data: pd.DataFrame) -> bool:
+    def should_buy(self, symbol: str, data: "pd.DataFrame") -> bool:
         """
         Check if we should buy a symbol.
         
@@ -57,7 +70,7 @@ class BaseStrategy(ABC):
         pass
     
     @abstractmethod
-    def should_sell(self, symbol: str, data: pd.DataFrame) -> bool:
+    def should_sell(self, symbol: str, data: "pd.DataFrame") -> bool:
         """
         Check if we should sell a symbol.
         
@@ -81,8 +94,7 @@ class BaseStrategy(ABC):
         Returns:
             float: Stop loss price.
         """
-        stop_loss_percentage = self.config["trading"]["stop_loss_percentage"]
-        return entry_price * (1 - stop_loss_percentage / 100)
+        return entry_price * self._stop_loss_factor
     
     def get_take_profit(self, symbol: str, entry_price: float) -> float:
         """
@@ -95,8 +107,7 @@ class BaseStrategy(ABC):
         Returns:
             float: Take profit price.
         """
-        take_profit_percentage = self.config["trading"]["take_profit_percentage"]
-        return entry_price * (1 + take_profit_percentage / 100)
+        return entry_price * self._take_profit_factor
     
     def get_position_size(self, symbol: str, price: float) -> float:
         """
@@ -109,17 +120,5 @@ class BaseStrategy(ABC):
         Returns:
             float: Position size.
         """
-        investment_amount = self.config["trading"]["investment_amount"]
-        risk_percentage = self.config["trading"]["risk_percentage"]
-        max_position_size = self.config["trading"]["max_position_size"]
-        
-        # Calculate position size based on risk percentage
-        position_size = (investment_amount * risk_percentage / 100) / len(self.config["trading"]["pairs"])
-        
-        # Limit position size to max_position_size
-        position_size = min(position_size, max_position_size)
-        
         # Convert to asset amount
-        asset_amount = position_size / price
-        
-        return asset_amount
+        return self._position_size / price
@@ -6,7 +6,8 @@ This module implements the Moving Average Crossover with RSI Confirmation strate
 
 import logging
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+import numpy as np
 
 from app.strategy.base import BaseStrategy
 from app.data.indicators import TechnicalIndicators
@@ -39,12 +40,24 @@ class MACrossoverStrategy(BaseStrategy):
         self.rsi_buy_threshold = config["indicators"]["rsi_buy_threshold"]
         self.rsi_sell_threshold = config["indicators"]["rsi_sell_threshold"]
         
-        logger.info(f"Initialized {self.name} strategy with parameters: "
-                   f"short_ma_period={self.short_ma_period}, "
-                   f"long_ma_period={self.long_ma_period}, "
-                   f"rsi_period={self.rsi_period}, "
-                   f"rsi_buy_threshold={self.rsi_buy_threshold}, "
-                   f"rsi_sell_threshold={self.rsi_sell_threshold}")
+        # Indicator column names
+        self._short_col = f"ma_{self.short_ma_period}"
+        self._long_col = f"ma_{self.long_ma_period}"
+        
+        # Indicator arrays of the last DataFrame seen for each symbol (shared by should_buy and should_sell)
+        self._view_cache: Dict[str, Tuple[pd.DataFrame, Tuple[np.ndarray, np.ndarray, np.ndarray]]] = {}
+        
+        # Signal calculator for this configuration
+        self.indicators = TechnicalIndicators(config)
+        
+        logger.info("Initialized %s strategy with parameters: "
+                   "short_ma_period=%s, "
+                   "long_ma_period=%s, "
+                   "rsi_period=%s, "
+                   "rsi_buy_threshold=%s, "
+                   "rsi_sell_threshold=%s",
+                   self.name, self.short_ma_period, self.long_ma_period, self.rsi_period,
+                   self.rsi_buy_threshold, self.rsi_sell_threshold)
     
     def generate_signals(self, data: Dict[str, pd.DataFrame]) -> Dict[str, int]:
         """
@@ -57,24 +70,42 @@ class MACrossoverStrategy(BaseStrategy):
             Dict[str, int]: Dictionary of signals (1 for buy, -1 for sell, 0 for no signal).
         """
         signals = {}
+        frames = {}
         
         for symbol, df in data.items():
             if len(df) < max(self.short_ma_period, self.long_ma_period, self.rsi_period) + 1:
-                logger.warning(f"Not enough data for {symbol} to generate signals")
+                logger.warning("Not enough data for %s to generate signals", symbol)
                 signals[symbol] = 0
                 continue
             
-            # Get combined signal
-            signal = TechnicalIndicators.get_combined_signal(df, self.config)
-            signals[symbol] = signal
-            
-            if signal == 1:
-                logger.info(f"Buy signal for {symbol}")
-            elif signal == -1:
-                logger.info(f"Sell signal for {symbol}")
+            frames[symbol] = df
+        
+        # Get combined signals of all symbols at once
+        signals.update(self.indicators.batch_signals(frames))
         
         return signals
     
+    def _indicator_arrays(self, symbol: str, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the short MA, long MA and RSI columns of a DataFrame as arrays.
+        
+        The arrays are cached per symbol until a different DataFrame is passed.
+        
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            data (pd.DataFrame): DataFrame with technical indicators.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Short MA, long MA and RSI values.
+        """
+        cached = self._view_cache.get(symbol)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        
+        arrays = (data[self._short_col].to_numpy(), data[self._long_col].to_numpy(), data["rsi"].to_numpy())
+        self._view_cache[symbol] = (data, arrays)
+        return arrays
+    
     def should_buy(self, symbol: str, data: pd.DataFrame) -> bool:
         """
         Check if we should buy a symbol.
@@ -87,25 +118,26 @@ class MACrossoverStrategy(BaseStrategy):
             bool: True if we should buy, False otherwise.
         """
         if len(data) < max(self.short_ma_period, self.long_ma_period, self.rsi_period) + 1:
-            logger.warning(f"Not enough data for {symbol} to check if we should buy")
+            logger.warning("Not enough data for %s to check if we should buy", symbol)
             return False
         
-        # Get the last two rows
-        last_row = data.iloc[-1]
-        prev_row = data.iloc[-2]
+        # Get the last two values of the indicators
+        short_ma, long_ma, rsi = self._indicator_arrays(symbol, data)
+        prev_short_ma, last_short_ma = short_ma[-2], short_ma[-1]
+        prev_long_ma, last_long_ma = long_ma[-2], long_ma[-1]
+        last_rsi = rsi[-1]
         
         # Check for MA crossover (bullish)
-        ma_crossover = (prev_row[f'ma_{self.short_ma_period}'] <= prev_row[f'ma_{self.long_ma_period}'] and
-                        last_row[f'ma_{self.short_ma_period}'] > last_row[f'ma_{self.long_ma_period}'])
+        ma_crossover = prev_short_ma <= prev_long_ma and last_short_ma > last_long_ma
         
         # Check RSI
-        rsi_condition = last_row['rsi'] >= 30 and last_row['rsi'] <= 50
+        rsi_condition = 30 <= last_rsi <= 50
         
         # Combined condition
         should_buy = ma_crossover and rsi_condition
         
         if should_buy:
-            logger.info(f"Should buy {symbol}: MA crossover (bullish) and RSI is {last_row['rsi']:.2f}")
+            logger.info("Should buy %s: MA crossover (bullish) and RSI is %.2f", symbol, last_rsi)
         
         return should_buy
     
@@ -121,27 +153,28 @@ class MACrossoverStrategy(BaseStrategy):
             bool: True if we should sell, False otherwise.
         """
         if len(data) < max(self.short_ma_period, self.long_ma_period, self.rsi_period) + 1:
-            logger.warning(f"Not enough data for {symbol} to check if we should sell")
+            logger.warning("Not enough data for %s to check if we should sell", symbol)
             return False
         
-        # Get the last two rows
-        last_row = data.iloc[-1]
-        prev_row = data.iloc[-2]
+        # Get the last two values of the indicators
+        short_ma, long_ma, rsi = self._indicator_arrays(symbol, data)
+        prev_short_ma, last_short_ma = short_ma[-2], short_ma[-1]
+        prev_long_ma, last_long_ma = long_ma[-2], long_ma[-1]
+        last_rsi = rsi[-1]
         
         # Check for MA crossover (bearish)
-        ma_crossover = (prev_row[f'ma_{self.short_ma_period}'] >= prev_row[f'ma_{self.long_ma_period}'] and
-                        last_row[f'ma_{self.short_ma_period}'] < last_row[f'ma_{self.long_ma_period}'])
+        ma_crossover = prev_short_ma >= prev_long_ma and last_short_ma < last_long_ma
         
         # Check RSI
-        rsi_condition = last_row['rsi'] >= 70
+        rsi_condition = last_rsi >= 70
         
         # Combined condition
         should_sell = ma_crossover or rsi_condition
         
         if should_sell:
             if ma_crossover:
-                logger.info(f"Should sell {symbol}: MA crossover (bearish)")
+                logger.info("Should sell %s: MA crossover (bearish)", symbol)
             if rsi_condition:
-                logger.info(f"Should sell {symbol}: RSI is {last_row['rsi']:.2f} (overbought)")
+                logger.info("Should sell %s: RSI is %.2f (overbought)", symbol, last_rsi)
         
         return should_sell
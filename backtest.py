@@ -7,20 +7,41 @@ This script runs a backtest of the trading bot's strategy on historical data.
 
 import asyncio
 import argparse
-import json
+import itertools
 from datetime import datetime, timedelta
 import logging
+from typing import Any, Dict, Iterator, TYPE_CHECKING
+import orjson
 
-from app.config import get_config, validate_config
-from app.bot import TradingBot
+if TYPE_CHECKING:
+    import numpy as np
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
+# Trade fields in output order, and the number of trades converted to records at a time
+TRADE_FIELDS = ("type", "price", "amount", "timestamp")
+TRADE_CHUNK_SIZE = 10000
+
+# Trade log line: timestamp, type, amount, symbol and price
+TRADE_LOG_FORMAT = "{} - {} {} {} at ${:.2f}"
+
+def iter_trades(trades: Dict[str, "np.ndarray"]) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the trades of a backtest result as records.
+    
+    Only TRADE_CHUNK_SIZE trades are converted from the trade columns at a time.
+    
+    Args:
+        trades (Dict[str, np.ndarray]): Trade columns of a backtest result.
+    
+    Returns:
+        Iterator[Dict[str, Any]]: Trade records.
+    """
+    for start in range(0, len(trades["type"]), TRADE_CHUNK_SIZE):
+        columns = [trades[field][start:start + TRADE_CHUNK_SIZE].tolist() for field in TRADE_FIELDS]
+        for values in zip(*columns):
+            yield dict(zip(TRADE_FIELDS, values))
+
 async def run_backtest(
     symbol: str,
     start_date: str,
@@ -38,21 +59,23 @@ async def run_backtest(
         end_date (str): End date (ISO format).
         timeframe (str, optional): Timeframe. Defaults to "15m".
         initial_balance (float, optional): Initial balance. Defaults to 100.0.
-        output_file (str, optional): Output file path. Defaults to None.
+        output_file (str, optional): Output file path (JSON Lines: the summary, then one line per trade). Defaults to None.
     """
-    # Validate configuration
-    if not validate_config():
+    # Import the bot only once the arguments are parsed (it loads ccxt, pandas and numba)
+    from app.bot import TradingBot
+    from app.config import validate_config
+    
+    # Validate and get configuration
+    valid, config = validate_config()
+    if not valid:
         logger.error("Bot is not properly configured. Check the logs for details.")
         return
     
-    # Get configuration
-    config = get_config()
-    
     # Create bot instance
     bot = TradingBot(config)
     
     # Run the backtest
-    logger.info(f"Running backtest for {symbol} from {start_date} to {end_date}")
+    logger.info("Running backtest for %s from %s to %s", symbol, start_date, end_date)
     result = await bot.backtest(
         symbol=symbol,
         start_date=start_date,
@@ -62,19 +85,33 @@ async def run_backtest(
     )
     
     # Print the result
-    logger.info(f"Backtest completed: Balance: ${result['final_balance']:.2f}, "
-               f"P/L: ${result['profit_loss']:.2f} ({result['profit_loss_percentage']:.2f}%)")
-    
-    # Print trades
-    logger.info(f"Trades: {len(result['trades'])}")
-    for trade in result['trades']:
-        logger.info(f"{trade['timestamp']} - {trade['type'].upper()} {trade['amount']} {symbol} at ${trade['price']:.2f}")
+    logger.info("Backtest completed: Balance: $%.2f, P/L: $%.2f (%.2f%%)",
+               result["final_balance"], result["profit_loss"], result["profit_loss_percentage"])
+    
+    # Print trades as a single log record (skipping the formatting entirely below INFO)
+    if logger.isEnabledFor(logging.INFO):
+        trades = result["trades"]
+        lines = map(
+            TRADE_LOG_FORMAT.format,
+            trades["timestamp"].tolist(),
+            map(str.upper, trades["type"].tolist()),
+            trades["amount"].tolist(),
+            itertools.repeat(symbol),
+            trades["price"].tolist(),
+        )
+        logger.info("Trades: %d\n%s", len(trades["type"]), "\n".join(lines))
     
     # Save the result to a file
     if output_file:
-        with open(output_file, "w") as f:
-            json.dump(result, f, indent=2)
-        logger.info(f"Backtest result saved to {output_file}")
+        summary = {key: value for key, value in result.items() if key != "trades"}
+        summary["trade_count"] = len(result["trades"]["type"])
+        
+        # Write the summary line, then stream the trades one line each
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE))
+            for trade in iter_trades(result["trades"]):
+                f.write(orjson.dumps(trade, option=orjson.OPT_APPEND_NEWLINE))
+        logger.info("Backtest result saved to %s", output_file)
 
 def parse_args():
     """
@@ -85,6 +122,11 @@ def parse_args():
     """
     parser = argparse.ArgumentParser(description="Run a backtest of the trading bot's strategy.")
     
+    # Default to the last 30 days (both dates from the same clock reading)
+    now = datetime.now()
+    end_default = now.date().isoformat()
+    start_default = (now - timedelta(days=30)).date().isoformat()
+    
     parser.add_argument(
         "--symbol",
         type=str,
@@ -95,14 +137,14 @@ def parse_args():
     parser.add_argument(
         "--start-date",
         type=str,
-        default=(datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d"),
+        default=start_default,
         help="Start date (ISO format).",
     )
     
     parser.add_argument(
         "--end-date",
         type=str,
-        default=datetime.now().strftime("%Y-%m-%d"),
+        default=end_default,
         help="End date (ISO format).",
     )
     
@@ -132,6 +174,19 @@ def parse_args():
 if __name__ == "__main__":
     args = parse_args()
     
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    
+    # Use the libuv event loop where available (uvloop does not support Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(run_backtest(
         symbol=args.symbol,
         start_date=args.start_date,
@@ -9,59 +9,34 @@ import asyncio
 import argparse
 import logging
 import signal
-import sys
 
-from app.config import get_config, validate_config
-from app.bot import TradingBot
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
-# Global variables
-bot_instance = None
-
 async def run_bot():
     """
-    Run the trading bot.
+    Run the trading bot until it is stopped by SIGINT or SIGTERM.
     """
-    global bot_instance
+    # Import the bot only once the arguments are parsed (it loads ccxt, pandas and numba)
+    from app.bot import TradingBot
+    from app.config import validate_config
     
-    # Validate configuration
-    if not validate_config():
+    # Validate and get configuration
+    valid, config = validate_config()
+    if not valid:
         logger.error("Bot is not properly configured. Check the logs for details.")
         return
     
-    # Get configuration
-    config = get_config()
-    
     # Create bot instance
-    bot_instance = TradingBot(config)
+    bot = TradingBot(config)
     
-    # Set up signal handlers
-    loop = asyncio.get_event_loop()
+    # Stop the bot on SIGINT/SIGTERM, letting run() finish its cleanup
+    loop = asyncio.get_running_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, lambda: asyncio.create_task(stop_bot()))
+        loop.add_signal_handler(sig, bot.stop)
     
     # Run the bot
     logger.info("Starting the trading bot...")
-    await bot_instance.run()
-
-async def stop_bot():
-    """
-    Stop the trading bot.
-    """
-    global bot_instance
-    
-    if bot_instance is not None:
-        logger.info("Stopping the trading bot...")
-        bot_instance.stop()
-    
-    # Exit the program
-    sys.exit(0)
+    await bot.run()
 
 def parse_args():
     """
@@ -84,5 +59,18 @@ def parse_args():
 if __name__ == "__main__":
     args = parse_args()
     
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    
+    # Use the libuv event loop where available (uvloop does not support Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run the bot
     asyncio.run(run_bot())